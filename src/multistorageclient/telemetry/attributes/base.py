@@ -41,9 +41,15 @@ def collect_attributes(attributes_providers: Sequence[AttributesProvider]) -> ap
     :param attributes_providers: Attributes providers to collect attributes from.
     :return: Merged attributes.
     """
+    # Fast path. Attributes providers return a new mapping on each call, so there's nothing to merge into.
+    if len(attributes_providers) == 1:
+        attributes = attributes_providers[0].attributes()
+        return {} if attributes is None else attributes
+
     merged_attributes: api_types.Attributes = {}
 
-    for attributes in [attributes_provider.attributes() for attributes_provider in attributes_providers]:
+    for attributes_provider in attributes_providers:
+        attributes = attributes_provider.attributes()
         if attributes is not None:
             merged_attributes.update(attributes)
 
@@ -230,9 +230,12 @@ class DiperiodicExportingMetricReader(sdk_metrics_export.MetricReader):
 
         with self._shutdown_event_lock:
             if not self._shutdown_event.is_set():
+                # Wake the daemons up immediately instead of waiting out their current interval.
+                #
+                # The export daemon does a final collect + export before exiting.
+                self._shutdown_event.set()
                 if self._collect_daemon is not None:
                     self._collect_daemon.join(timeout=(deadline_ns - time.time_ns()) / 10**9)
                 if self._export_daemon is not None:
                     self._export_daemon.join(timeout=(deadline_ns - time.time_ns()) / 10**9)
                 self._exporter.shutdown(timeout_millis=(deadline_ns - time.time_ns()) / 10**6)
-                self._shutdown_event.set()
@@ -24,6 +24,7 @@ import pytest
 import test_multistorageclient.unit.utils.tempdatastore as tempdatastore
 from multistorageclient import StorageClient, StorageClientConfig
 from multistorageclient.types import MetadataProvider, ObjectMetadata
+from test_multistorageclient.unit.utils.mocks import InMemoryByteStoreProvider
 
 
 class UuidMetadataProvider(MetadataProvider):
@@ -98,10 +99,15 @@ class UuidMetadataProvider(MetadataProvider):
 
 
 @pytest.mark.parametrize(
-    argnames=["temp_data_store_type"],
-    argvalues=[[tempdatastore.TemporaryPOSIXDirectory], [tempdatastore.TemporaryAWSS3Bucket]],
+    argnames=["temp_data_store_type", "in_memory"],
+    argvalues=[
+        # The temporary POSIX directory only backs the profile; objects live in memory.
+        [tempdatastore.TemporaryPOSIXDirectory, True],
+        [tempdatastore.TemporaryPOSIXDirectory, False],
+        pytest.param(tempdatastore.TemporaryAWSS3Bucket, False, marks=pytest.mark.slow),
+    ],
 )
-def test_uuid_metadata_provider(temp_data_store_type: type[tempdatastore.TemporaryDataStore]):
+def test_uuid_metadata_provider(temp_data_store_type: type[tempdatastore.TemporaryDataStore], in_memory: bool):
     with temp_data_store_type() as temp_data_store:
         data_with_uuid_profile = "uuid"
 
@@ -117,6 +123,8 @@ def test_uuid_metadata_provider(temp_data_store_type: type[tempdatastore.Tempora
         storage_client = StorageClient(
             config=StorageClientConfig.from_dict(config_dict=storage_client_config_dict, profile=data_with_uuid_profile)
         )
+        if in_memory:
+            storage_client._storage_provider = InMemoryByteStoreProvider()
         storage_client._metadata_provider = UuidMetadataProvider()
 
         # Dictionary of filepaths to content
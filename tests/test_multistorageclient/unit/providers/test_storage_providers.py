@@ -13,232 +13,360 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import functools
 import os
-import tempfile
+import pathlib
 import uuid
+from collections.abc import Iterator
+from typing import Union
 
 import pytest
 
 import multistorageclient.telemetry as telemetry
 import test_multistorageclient.unit.utils.tempdatastore as tempdatastore
 from multistorageclient import StorageClient, StorageClientConfig
-from multistorageclient.constants import MEMORY_LOAD_LIMIT
-from multistorageclient.types import PreconditionFailedError
+from multistorageclient.cache import CacheBackendFactory
+from multistorageclient.caching.cache_config import CacheBackendConfig, CacheConfig
+from multistorageclient.file import ObjectFile, RemoteFileReader
+from multistorageclient.types import ObjectMetadata, PreconditionFailedError
 from test_multistorageclient.unit.utils.telemetry.metrics.export import InMemoryMetricExporter
 
+#: Memory load limit (+ multipart upload threshold) used by the large file tests.
+#:
+#: The default limits are hundreds of MB. Shrink them so the same code paths are exercised with a few KB.
+LARGE_FILE_MEMORY_LOAD_LIMIT = 4 * 1024
+#: Large file body. Shared across parametrizations instead of being rebuilt per test.
+LARGE_FILE_BODY_BYTES = b"\x00" * (LARGE_FILE_MEMORY_LOAD_LIMIT + 1)
+#: Short test IDs for the temporary data store types.
+TEMP_DATA_STORE_TYPE_IDS: dict[type[tempdatastore.TemporaryDataStore], str] = {
+    tempdatastore.TemporaryPOSIXDirectory: "posix",
+    tempdatastore.TemporaryAWSS3Bucket: "s3",
+    tempdatastore.TemporaryAzureBlobStorageContainer: "azure",
+    tempdatastore.TemporaryGoogleCloudStorageBucket: "gcs",
+    tempdatastore.TemporarySwiftStackBucket: "swift",
+}
+
+
+def _yields_exactly_one(iterator: Iterator) -> bool:
+    """
+    Check an iterator yields exactly one item.
 
-@pytest.mark.parametrize(
-    argnames=["temp_data_store_type"],
-    argvalues=[
-        [tempdatastore.TemporaryPOSIXDirectory],
-        [tempdatastore.TemporaryAWSS3Bucket],
-        [tempdatastore.TemporaryAzureBlobStorageContainer],
-        [tempdatastore.TemporaryGoogleCloudStorageBucket],
-        [tempdatastore.TemporarySwiftStackBucket],
+    Stops after the second item so listing checks don't page through a wide prefix.
+    """
+    return next(iterator, None) is not None and next(iterator, None) is None
+
+
+def _build_storage_client(temp_data_store: tempdatastore.TemporaryDataStore) -> StorageClient:
+    """
+    Build a storage client with a single profile for the temporary data store.
+    """
+    profile = "data"
+    config_dict = {"profiles": {profile: temp_data_store.profile_config_dict()}}
+    return StorageClient(config=StorageClientConfig.from_dict(config_dict=config_dict, profile=profile))
+
+
+def _build_telemetry_storage_client_config(
+    temp_data_store: tempdatastore.TemporaryDataStore, with_cache: bool, telemetry_resources: telemetry.Telemetry
+) -> StorageClientConfig:
+    """
+    Build a storage client config with metrics and (optionally) a cache for the temporary data store.
+    """
+    profile = "data"
+    profile_config_dict = temp_data_store.profile_config_dict()
+    # Keep multipart uploads covered by the large file test. The GCS emulator doesn't support them.
+    if profile_config_dict["storage_provider"]["type"] in {"s3", "s8k"}:
+        profile_config_dict["storage_provider"]["options"]["multipart_threshold"] = LARGE_FILE_MEMORY_LOAD_LIMIT
+    config_dict = {
+        "profiles": {profile: profile_config_dict},
+        "opentelemetry": {
+            "metrics": {
+                "attributes": [
+                    {"type": "static", "options": {"attributes": {"cluster": "local"}}},
+                    {"type": "host", "options": {"attributes": {"node": "name"}}},
+                    {"type": "process", "options": {"attributes": {"process": "pid"}}},
+                ],
+                "exporter": {"type": telemetry._fully_qualified_name(InMemoryMetricExporter)},
+            },
+        },
+    }
+    if with_cache:
+        config_dict["cache"] = {"size": "10M", "use_etag": True, "eviction_policy": {"policy": "random"}}
+    return StorageClientConfig.from_dict(config_dict=config_dict, profile=profile, telemetry=telemetry_resources)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(
+            temp_data_store_type,
+            # With `--dist loadgroup`, keep a data store type's tests on one worker (sharing the module fixture).
+            marks=pytest.mark.xdist_group(name=temp_data_store_type.__name__),
+            id=temp_data_store_type_id,
+        )
+        for temp_data_store_type, temp_data_store_type_id in TEMP_DATA_STORE_TYPE_IDS.items()
     ],
 )
-@pytest.mark.parametrize(argnames=["with_cache"], argvalues=[[True], [False]])
-def test_storage_providers(temp_data_store_type: type[tempdatastore.TemporaryDataStore], with_cache: bool):
-    telemetry_resources: telemetry.Telemetry = telemetry.init(mode=telemetry.TelemetryMode.LOCAL)
+def temp_data_store(request: pytest.FixtureRequest) -> Iterator[tempdatastore.TemporaryDataStore]:
+    """
+    Temporary data store shared by all tests in the module for a data store type.
 
+    Tests must isolate themselves under a unique key prefix.
+    """
+    temp_data_store_type: type[tempdatastore.TemporaryDataStore] = request.param
     with temp_data_store_type() as temp_data_store:
-        profile = "data"
-        config_dict = {
-            "profiles": {profile: temp_data_store.profile_config_dict()},
-            "opentelemetry": {
-                "metrics": {
-                    "attributes": [
-                        {"type": "static", "options": {"attributes": {"cluster": "local"}}},
-                        {"type": "host", "options": {"attributes": {"node": "name"}}},
-                        {"type": "process", "options": {"attributes": {"process": "pid"}}},
-                    ],
-                    "exporter": {"type": telemetry._fully_qualified_name(InMemoryMetricExporter)},
-                },
-            },
-        }
-        if with_cache:
-            config_dict["cache"] = {"size": "10M", "use_etag": True, "eviction_policy": {"policy": "random"}}
-        storage_client = StorageClient(
-            config=StorageClientConfig.from_dict(
-                config_dict=config_dict, profile=profile, telemetry=telemetry_resources
-            )
-        )
+        yield temp_data_store
 
-        file_extension = ".txt"
-        # Add a random string to the file path below so concurrent tests don't conflict.
-        file_path_fragments = [f"{uuid.uuid4()}-prefix", "infix", f"suffix{file_extension}"]
-        file_path = os.path.join(*file_path_fragments)
-        file_body_bytes = b"\x00"
-        file_body_string = file_body_bytes.decode()
 
-        # Check the file doesn't exist.
-        with pytest.raises(Exception):
-            storage_client.read(path=file_path)
+@pytest.fixture(scope="module")
+def telemetry_storage_client_configs(
+    temp_data_store: tempdatastore.TemporaryDataStore,
+) -> dict[bool, StorageClientConfig]:
+    """
+    Storage client configs with metrics for the shared temporary data store, keyed by whether they have a cache.
 
-        # Write a file.
-        storage_client.write(path=file_path, body=file_body_bytes)
+    Built once per data store and dropped with it, so tests don't repeat config validation + provider construction.
+    """
+    telemetry_resources: telemetry.Telemetry = telemetry.init(mode=telemetry.TelemetryMode.LOCAL)
+    return {
+        with_cache: _build_telemetry_storage_client_config(
+            temp_data_store=temp_data_store, with_cache=with_cache, telemetry_resources=telemetry_resources
+        )
+        for with_cache in (True, False)
+    }
 
-        # Check the file contents.
-        assert storage_client.read(path=file_path) == file_body_bytes
 
-        # Check the file metadata.
-        file_info = storage_client.info(path=file_path)
-        assert file_info is not None
-        assert file_info.key.endswith(file_path)
-        assert file_info.content_length == len(file_body_bytes)
-        assert file_info.type == "file"
-        assert file_info.last_modified is not None
-        for lead in ["", "/"]:
-            assert storage_client.is_file(path=f"{lead}{file_path}")
-            assert not storage_client.is_file(path=lead)
-            assert not storage_client.is_file(path=f"{lead}{file_path_fragments[0]}-nonexistent")
-            assert not storage_client.is_file(path=f"{lead}{file_path_fragments[0]}")
-
-        assert len(list(storage_client.list(prefix=file_path_fragments[0]))) == 1
-        file_info_list = list(storage_client.list(prefix=os.path.join(*file_path_fragments[:2])))
-        assert len(file_info_list) == 1
-        listed_file_info = file_info_list[0]
-        assert listed_file_info is not None
-        assert listed_file_info.key.endswith(file_path)
-        assert listed_file_info.content_length == file_info.content_length
-        assert listed_file_info.type == file_info.type
-        # There's some timestamp precision differences. Truncate to second.
-        assert listed_file_info.last_modified.replace(microsecond=0) == file_info.last_modified.replace(microsecond=0)
-
-        # Glob the file.
-        assert len(storage_client.glob(pattern=f"*{file_extension}-nonexistent")) == 0
-        assert len(storage_client.glob(pattern=os.path.join("**", f"*{file_extension}-nonexistent"))) == 0
-        assert storage_client.glob(pattern="*")[0] == file_path_fragments[0], "glob should return the directory"
-        assert len(storage_client.glob(pattern=f"*{file_extension}")) == 0
-        assert len(storage_client.glob(pattern=os.path.join("**", f"*{file_extension}"))) == 1
-        assert storage_client.glob(pattern=os.path.join("**", f"*{file_extension}"))[0] == file_path
-
-        # Check the infix directory metadata.
-        for tail in ["", "/"]:
-            directory_path = os.path.join(*file_path_fragments[:2])
-            directory_info = storage_client.info(path=f"{directory_path}{tail}")
-            assert directory_info is not None
-            assert directory_info.key.endswith(f"{directory_path}/")
-            assert directory_info.type == "directory"
-
-        # List the infix directory.
-        assert len(list(storage_client.list(prefix=f"{file_path_fragments[0]}/", include_directories=True))) == 1
-
-        # List based on the partial prefix
-        assert len(list(storage_client.list(prefix=f"{file_path_fragments[0]}/in", include_directories=True))) == 1
-        assert len(list(storage_client.list(prefix=f"{file_path_fragments[0]}/in", include_directories=False))) == 1
-        assert (
-            len(list(storage_client.list(prefix=f"{file_path_fragments[0]}/infix/suffix", include_directories=True)))
-            == 1
-        )
-        assert (
-            len(list(storage_client.list(prefix=f"{file_path_fragments[0]}/infix/suffix", include_directories=False)))
-            == 1
-        )
+@pytest.fixture(params=[True, False], ids=["cache", "no-cache"])
+def storage_client(
+    telemetry_storage_client_configs: dict[bool, StorageClientConfig], request: pytest.FixtureRequest
+) -> StorageClient:
+    """
+    Storage client with + without a cache for the shared temporary data store.
+    """
+    return StorageClient(config=telemetry_storage_client_configs[request.param])
 
-        # Delete the file.
-        storage_client.delete(path=file_path)
-
-        # Upload + download the file.
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(file_body_bytes)
-            temp_file.close()
-            storage_client.upload_file(remote_path=file_path, local_path=temp_file.name)
-        assert storage_client.is_file(path=file_path)
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.close()
-            storage_client.download_file(remote_path=file_path, local_path=temp_file.name)
-            assert os.path.getsize(temp_file.name) == len(file_body_bytes)
-
-        # Delete the file.
-        storage_client.delete(path=file_path)
-
-        # Open the file for writes + reads (bytes).
-        with storage_client.open(path=file_path, mode="wb") as file:
-            file.write(file_body_bytes)
-        assert storage_client.is_file(path=file_path)
-        with storage_client.open(path=file_path, mode="rb") as file:
-            assert file.read() == file_body_bytes
-
-        # Delete the file.
-        storage_client.delete(path=file_path)
-
-        # Open the file for writes + reads (string).
-        with storage_client.open(path=file_path, mode="w") as file:
-            file.write(file_body_string)
-        assert storage_client.is_file(path=file_path)
-        with storage_client.open(path=file_path, mode="r") as file:
-            assert file.read() == file_body_string
-
-        # Copy the file.
-        file_copy_path_fragments = ["copy", *file_path_fragments]
-        file_copy_path = os.path.join(*file_copy_path_fragments)
-        storage_client.copy(src_path=file_path, dest_path=file_copy_path)
-        assert storage_client.read(path=file_copy_path) == file_body_bytes
-
-        # Delete the file and its copy.
-        for path in [file_path, file_copy_path]:
-            storage_client.delete(path=path)
-        assert len(list(storage_client.list(prefix=file_path_fragments[0]))) == 0
-        assert len(list(storage_client.list(prefix=file_copy_path_fragments[0]))) == 0
-
-        # Open the file for appends (bytes).
-        with storage_client.open(path=file_path, mode="ab") as file:
-            file.write(file_body_bytes)
-        assert storage_client.is_file(path=file_path)
-        with storage_client.open(path=file_path, mode="rb") as file:
-            assert file.read() == file_body_bytes
-
-        # Delete the file.
-        storage_client.delete(path=file_path)
-
-        # Open the file for appends (string).
-        with storage_client.open(path=file_path, mode="a") as file:
-            file.write(file_body_string)
-        assert storage_client.is_file(path=file_path)
-        with storage_client.open(path=file_path, mode="r") as file:
-            assert file.read() == file_body_string
-
-        # Delete the file.
-        storage_client.delete(path=file_path)
-
-        # Open the file for writes + reads (bytes).
-        if storage_client._storage_provider._provider_name == "gcs":
-            # GCS simulator does not support multipart uploads
-            large_file_body_bytes = b"\x00" * MEMORY_LOAD_LIMIT
-        else:
-            large_file_body_bytes = b"\x00" * (MEMORY_LOAD_LIMIT + 1)
-        with storage_client.open(path=file_path, mode="wb") as file:
-            file.write(large_file_body_bytes)
-        assert storage_client.is_file(path=file_path)
-        with storage_client.open(path=file_path, mode="rb") as file:
-            content = b""
-            for chunk in iter(functools.partial(file.read, (MEMORY_LOAD_LIMIT // 2)), b""):
-                content += chunk
-            assert len(content) == len(large_file_body_bytes)
-
-        # Delete the file.
-        storage_client.delete(path=file_path)
 
-        # Write files.
-        file_numbers = range(1, 3)
-        for i in file_numbers:
-            storage_client.write(path=f"{i}{file_extension}", body=file_body_bytes)
+def test_storage_providers(
+    temp_data_store: tempdatastore.TemporaryDataStore, storage_client: StorageClient, tmp_path: pathlib.Path
+):
+    file_extension = ".txt"
+    # Add a random string to the file path below so concurrent tests don't conflict.
+    file_path_fragments = [f"{uuid.uuid4()}-prefix", "infix", f"suffix{file_extension}"]
+    file_path = os.path.join(*file_path_fragments)
+    directory_path = os.path.join(*file_path_fragments[:2])
+    glob_pattern = os.path.join("**", f"*{file_extension}")
+    file_body_bytes = b"\x00"
+    file_body_string = file_body_bytes.decode()
+
+    # Check the file doesn't exist.
+    with pytest.raises(Exception):
+        storage_client.read(path=file_path)
+
+    # Write a file.
+    storage_client.write(path=file_path, body=file_body_bytes)
+
+    # Check the file contents.
+    assert storage_client.read(path=file_path) == file_body_bytes
+
+    # Check the file metadata.
+    file_info = storage_client.info(path=file_path)
+    assert file_info is not None
+    assert file_info.key.endswith(file_path)
+    assert file_info.content_length == len(file_body_bytes)
+    assert file_info.type == "file"
+    assert file_info.last_modified is not None
+    # There's no batch metadata query, so issue the checks concurrently.
+    is_file_expectations: dict[str, bool] = {}
+    for lead in ["", "/"]:
+        is_file_expectations[f"{lead}{file_path}"] = True
+        is_file_expectations[lead] = False
+        is_file_expectations[f"{lead}{file_path_fragments[0]}-nonexistent"] = False
+        is_file_expectations[f"{lead}{file_path_fragments[0]}"] = False
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(is_file_expectations)) as executor:
+        is_file_results = executor.map(lambda path: storage_client.is_file(path=path), is_file_expectations)
+        for (path, expected), result in zip(is_file_expectations.items(), is_file_results):
+            assert result == expected, path
+
+    assert _yields_exactly_one(storage_client.list(prefix=file_path_fragments[0]))
+    file_info_list = list(storage_client.list(prefix=directory_path))
+    assert len(file_info_list) == 1
+    listed_file_info = file_info_list[0]
+    assert listed_file_info is not None
+    assert listed_file_info.key.endswith(file_path)
+    assert listed_file_info.content_length == file_info.content_length
+    assert listed_file_info.type == file_info.type
+    # There's some timestamp precision differences. Truncate to second.
+    assert listed_file_info.last_modified.replace(microsecond=0) == file_info.last_modified.replace(microsecond=0)
+
+    # Glob the file.
+    assert len(storage_client.glob(pattern=f"*{file_extension}-nonexistent")) == 0
+    assert len(storage_client.glob(pattern=f"{glob_pattern}-nonexistent")) == 0
+    assert file_path_fragments[0] in storage_client.glob(pattern="*"), "glob should return the directory"
+    assert len(storage_client.glob(pattern=f"*{file_extension}")) == 0
+    glob_results = storage_client.glob(pattern=glob_pattern)
+    assert len(glob_results) == 1
+    assert glob_results[0] == file_path
+
+    # Check the infix directory metadata.
+    for tail in ["", "/"]:
+        directory_info = storage_client.info(path=f"{directory_path}{tail}")
+        assert directory_info is not None
+        assert directory_info.key.endswith(f"{directory_path}/")
+        assert directory_info.type == "directory"
+
+    # List the infix directory.
+    assert _yields_exactly_one(storage_client.list(prefix=f"{file_path_fragments[0]}/", include_directories=True))
+
+    # List based on the partial prefix
+    assert _yields_exactly_one(storage_client.list(prefix=f"{file_path_fragments[0]}/in", include_directories=True))
+    assert _yields_exactly_one(storage_client.list(prefix=f"{file_path_fragments[0]}/in", include_directories=False))
+    assert _yields_exactly_one(
+        storage_client.list(prefix=f"{file_path_fragments[0]}/infix/suffix", include_directories=True)
+    )
+    assert _yields_exactly_one(
+        storage_client.list(prefix=f"{file_path_fragments[0]}/infix/suffix", include_directories=False)
+    )
+
+    # Delete the file.
+    storage_client.delete(path=file_path)
+
+    # Upload + download the file.
+    local_file_path = tmp_path / "body.bin"
+    local_file_path.write_bytes(file_body_bytes)
+    storage_client.upload_file(remote_path=file_path, local_path=str(local_file_path))
+    assert storage_client.is_file(path=file_path)
+    local_file_path.unlink()
+    storage_client.download_file(remote_path=file_path, local_path=str(local_file_path))
+    assert os.path.getsize(local_file_path) == len(file_body_bytes)
+
+    # Delete the file.
+    storage_client.delete(path=file_path)
+
+    # Open files for writes + reads (bytes + string) and appends + reads (bytes + string).
+    #
+    # Use a path per write mode so no deletes are needed between modes, which lets the opens run concurrently.
+    open_modes: dict[str, tuple[str, Union[bytes, str]]] = {
+        "wb": ("rb", file_body_bytes),
+        "w": ("r", file_body_string),
+        "ab": ("rb", file_body_bytes),
+        "a": ("r", file_body_string),
+    }
+    # Appends are emulated with a download + re-upload for object stores. Azure keeps that path covered.
+    if isinstance(
+        temp_data_store, (tempdatastore.TemporaryAWSS3Bucket, tempdatastore.TemporaryGoogleCloudStorageBucket)
+    ):
+        for append_mode in ["ab", "a"]:
+            del open_modes[append_mode]
+    open_mode_file_paths = {
+        write_mode: os.path.join(file_path_fragments[0], write_mode, *file_path_fragments[1:])
+        for write_mode in open_modes
+    }
+
+    def write_file(write_mode: str) -> None:
+        with storage_client.open(path=open_mode_file_paths[write_mode], mode=write_mode) as file:
+            file.write(open_modes[write_mode][1])
+
+    def read_file(write_mode: str) -> Union[bytes, str]:
+        with storage_client.open(path=open_mode_file_paths[write_mode], mode=open_modes[write_mode][0]) as file:
+            return file.read()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(open_modes)) as executor:
+        list(executor.map(write_file, open_modes))
+        for open_mode_file_path in open_mode_file_paths.values():
+            assert storage_client.is_file(path=open_mode_file_path)
+        for write_mode, content in zip(open_modes, executor.map(read_file, open_modes)):
+            assert content == open_modes[write_mode][1]
+
+    # Copy the file.
+    file_copy_path_fragments = ["copy", *file_path_fragments]
+    file_copy_path = os.path.join(*file_copy_path_fragments)
+    storage_client.copy(src_path=open_mode_file_paths["w"], dest_path=file_copy_path)
+    assert storage_client.read(path=file_copy_path) == file_body_bytes
+
+    # Delete the files and the copy. There's no batch delete, so issue the deletes concurrently.
+    delete_paths = [*open_mode_file_paths.values(), file_copy_path]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(delete_paths)) as executor:
+        list(executor.map(lambda path: storage_client.delete(path=path), delete_paths))
+    assert next(storage_client.list(prefix=file_path_fragments[0]), None) is None
+    assert next(storage_client.list(prefix=file_copy_path_fragments[0]), None) is None
+
+    # Write files.
+    file_numbers = range(1, 3)
+
+    def write_numbered_file(i: int) -> None:
+        storage_client.write(path=f"{file_path_fragments[0]}/{i}{file_extension}", body=file_body_bytes)
+
+    def list_numbered_file(i: int) -> list[ObjectMetadata]:
+        return list(
+            storage_client.list(
+                prefix=f"{file_path_fragments[0]}/",
+                start_after=f"{file_path_fragments[0]}/{i - 1}{file_extension}",
+                end_at=f"{file_path_fragments[0]}/{i}{file_extension}",
+            )
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(file_numbers)) as executor:
+        list(executor.map(write_numbered_file, file_numbers))
 
         # List the files (paginated).
-        for i in file_numbers:
-            files = list(
-                storage_client.list(prefix="", start_after=f"{i - 1}{file_extension}", end_at=f"{i}{file_extension}")
-            )
+        for i, files in zip(file_numbers, executor.map(list_numbered_file, file_numbers)):
             assert len(files) == 1
             assert files[0].key.endswith(f"{i}{file_extension}")
 
-        # Delete all the files recursively.
-        storage_client.delete(path="", recursive=True)
-        # Verify deletes
-        for i in file_numbers:
-            assert not storage_client.is_file(path=f"{i}{file_extension}")
+    # Delete all the files recursively.
+    storage_client.delete(path=f"{file_path_fragments[0]}/", recursive=True)
+    # Verify deletes
+    for i in file_numbers:
+        assert not storage_client.is_file(path=f"{file_path_fragments[0]}/{i}{file_extension}")
+
+
+def test_storage_providers_large_file(telemetry_storage_client_configs: dict[bool, StorageClientConfig]):
+    # Cached reads of objects at least the cache size skip the cache (see
+    # test_storage_providers_large_file_exceeds_cache), so only run once per data store type.
+    storage_client = StorageClient(config=telemetry_storage_client_configs[False])
+
+    # Add a random string to the file path below so concurrent tests don't conflict.
+    file_path = os.path.join(f"{uuid.uuid4()}-prefix", "infix", "suffix.bin")
+
+    # Open the file for writes + reads (bytes).
+    with storage_client.open(path=file_path, mode="wb") as file:
+        file.write(LARGE_FILE_BODY_BYTES)
+    assert storage_client.is_file(path=file_path)
+    # The memory load limit is bound as a default argument at import time, so pass it explicitly.
+    with storage_client.open(path=file_path, mode="rb", memory_load_limit=LARGE_FILE_MEMORY_LOAD_LIMIT) as file:
+        content = bytearray()
+        for chunk in iter(functools.partial(file.read, (LARGE_FILE_MEMORY_LOAD_LIMIT // 2)), b""):
+            content.extend(chunk)
+        assert len(content) == len(LARGE_FILE_BODY_BYTES)
+
+    # Delete the file.
+    storage_client.delete(path=file_path)
+
+
+def test_storage_providers_large_file_exceeds_cache(tmp_path: pathlib.Path):
+    with tempdatastore.TemporaryPOSIXDirectory() as temp_data_store:
+        storage_client = _build_storage_client(temp_data_store=temp_data_store)
+        # The config schema's smallest cache size is 1M, so attach a cache smaller than the large file body directly.
+        storage_client._cache_manager = CacheBackendFactory.create(
+            profile=storage_client.profile,
+            cache_config=CacheConfig(size="0.001M", backend=CacheBackendConfig(cache_path=str(tmp_path))),
+        )
+        assert storage_client._cache_manager.get_max_cache_size() < len(LARGE_FILE_BODY_BYTES)
+
+        file_path = "suffix.bin"
+        storage_client.write(path=file_path, body=LARGE_FILE_BODY_BYTES)
+
+        # POSIX clients open files directly, so build the object file to go through the cached read path.
+        with ObjectFile(
+            storage_client=storage_client,
+            remote_path=file_path,
+            mode="rb",
+            memory_load_limit=LARGE_FILE_MEMORY_LOAD_LIMIT,
+        ) as file:
+            assert file.read() == LARGE_FILE_BODY_BYTES
+            # Objects at least the cache size are read without being cached.
+            assert isinstance(file._file, RemoteFileReader)
+        assert storage_client._cache_manager.cache_size() == 0
 
 
 @pytest.mark.parametrize(
@@ -249,15 +377,14 @@ def test_storage_providers(temp_data_store_type: type[tempdatastore.TemporaryDat
         [tempdatastore.TemporaryGoogleCloudStorageBucket],
         [tempdatastore.TemporarySwiftStackBucket],
     ],
+    ids=TEMP_DATA_STORE_TYPE_IDS.get,
 )
 @pytest.mark.parametrize(argnames=["with_cache"], argvalues=[[True], [False]])
 def test_storage_providers_list_directories(
     temp_data_store_type: type[tempdatastore.TemporaryDataStore], with_cache: bool
 ):
     with temp_data_store_type() as temp_data_store:
-        profile = "data"
-        config_dict = {"profiles": {profile: temp_data_store.profile_config_dict()}}
-        storage_client = StorageClient(config=StorageClientConfig.from_dict(config_dict=config_dict, profile=profile))
+        storage_client = _build_storage_client(temp_data_store)
 
         # Create empty directories
         storage_client.write(path="dir1/", body=b"")
@@ -283,16 +410,15 @@ def test_storage_providers_list_directories(
         [tempdatastore.TemporarySwiftStackBucket],
         [tempdatastore.TemporaryPOSIXDirectory],
     ],
+    ids=TEMP_DATA_STORE_TYPE_IDS.get,
 )
 def test_put_object_with_etag_metadata(temp_data_store_type: type[tempdatastore.TemporaryDataStore]):
     with temp_data_store_type() as temp_data_store:
-        profile = "data"
-        config_dict = {"profiles": {profile: temp_data_store.profile_config_dict()}}
-        storage_client = StorageClient(config=StorageClientConfig.from_dict(config_dict=config_dict, profile=profile))
+        storage_client = _build_storage_client(temp_data_store)
         storage_provider = storage_client._storage_provider
 
         # Test file details
-        bucket = config_dict["profiles"][profile]["storage_provider"]["options"]["base_path"]
+        bucket = temp_data_store.profile_config_dict()["storage_provider"]["options"]["base_path"]
         key = "test_etag.txt"  # Use just the key part
         file_path = f"{bucket}/{key}"
         file_body = b"test content"
@@ -327,16 +453,15 @@ def test_put_object_with_etag_metadata(temp_data_store_type: type[tempdatastore.
         [tempdatastore.TemporarySwiftStackBucket],
         [tempdatastore.TemporaryPOSIXDirectory],
     ],
+    ids=TEMP_DATA_STORE_TYPE_IDS.get,
 )
 def test_delete_object_with_etag(temp_data_store_type: type[tempdatastore.TemporaryDataStore]):
     with temp_data_store_type() as temp_data_store:
-        profile = "data"
-        config_dict = {"profiles": {profile: temp_data_store.profile_config_dict()}}
-        storage_client = StorageClient(config=StorageClientConfig.from_dict(config_dict=config_dict, profile=profile))
+        storage_client = _build_storage_client(temp_data_store)
         storage_provider = storage_client._storage_provider
 
         # Test file details
-        bucket = config_dict["profiles"][profile]["storage_provider"]["options"]["base_path"]
+        bucket = temp_data_store.profile_config_dict()["storage_provider"]["options"]["base_path"]
         key = "test_delete_etag.txt"
         file_path = f"{bucket}/{key}"
         file_body = b"test content"
@@ -381,16 +506,15 @@ def test_delete_object_with_etag(temp_data_store_type: type[tempdatastore.Tempor
     argvalues=[
         [tempdatastore.TemporaryPOSIXDirectory],
     ],
+    ids=TEMP_DATA_STORE_TYPE_IDS.get,
 )
 def test_posix_xattr_metadata(temp_data_store_type: type[tempdatastore.TemporaryDataStore]):
     with temp_data_store_type() as temp_data_store:
-        profile = "data"
-        config_dict = {"profiles": {profile: temp_data_store.profile_config_dict()}}
-        storage_client = StorageClient(config=StorageClientConfig.from_dict(config_dict=config_dict, profile=profile))
+        storage_client = _build_storage_client(temp_data_store)
         storage_provider = storage_client._storage_provider
 
         # Test file details
-        bucket = config_dict["profiles"][profile]["storage_provider"]["options"]["base_path"]
+        bucket = temp_data_store.profile_config_dict()["storage_provider"]["options"]["base_path"]
         key = "test_xattr.txt"
         file_path = f"{bucket}/{key}"
         file_body = b"test content"
@@ -435,19 +559,18 @@ def test_posix_xattr_metadata(temp_data_store_type: type[tempdatastore.Temporary
         [tempdatastore.TemporaryGoogleCloudStorageBucket],
         [tempdatastore.TemporarySwiftStackBucket],
     ],
+    ids=TEMP_DATA_STORE_TYPE_IDS.get,
 )
 def test_put_object_with_conditional_params(temp_data_store_type: type[tempdatastore.TemporaryDataStore]):
     """
     Test put_object with if_match and if_none_match parameters.
     """
     with temp_data_store_type() as temp_data_store:
-        profile = "data"
-        config_dict = {"profiles": {profile: temp_data_store.profile_config_dict()}}
-        storage_client = StorageClient(config=StorageClientConfig.from_dict(config_dict=config_dict, profile=profile))
+        storage_client = _build_storage_client(temp_data_store)
         storage_provider = storage_client._storage_provider
 
         # Test file details
-        bucket = config_dict["profiles"][profile]["storage_provider"]["options"]["base_path"]
+        bucket = temp_data_store.profile_config_dict()["storage_provider"]["options"]["base_path"]
         key = "test_conditional.txt"
         file_path = f"{bucket}/{key}"
         file_body = b"test content"
@@ -502,6 +625,7 @@ def test_put_object_with_conditional_params(temp_data_store_type: type[tempdatas
         [tempdatastore.TemporarySwiftStackBucket],
         [tempdatastore.TemporaryPOSIXDirectory],
     ],
+    ids=TEMP_DATA_STORE_TYPE_IDS.get,
 )
 def test_storage_with_root_base_path(temp_data_store_type: type[tempdatastore.TemporaryDataStore]):
     with temp_data_store_type() as temp_data_store:
@@ -532,4 +656,4 @@ def test_storage_with_root_base_path(temp_data_store_type: type[tempdatastore.Te
         for fname in file_names:
             storage_client.delete(path=fname)
 
-        assert len(list(storage_client.list(prefix=bucket))) == 0
+        assert next(storage_client.list(prefix=bucket), None) is None
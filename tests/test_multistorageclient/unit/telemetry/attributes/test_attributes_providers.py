@@ -15,10 +15,11 @@
 
 import hashlib
 import os
+from typing import Union
 
 import pytest
 
-from multistorageclient.telemetry.attributes.base import collect_attributes
+from multistorageclient.telemetry.attributes.base import AttributesProvider, collect_attributes
 from multistorageclient.telemetry.attributes.environment_variables import EnvironmentVariablesAttributesProvider
 from multistorageclient.telemetry.attributes.host import HostAttributesProvider
 from multistorageclient.telemetry.attributes.msc_config import MSCConfigAttributesProvider
@@ -26,9 +27,39 @@ from multistorageclient.telemetry.attributes.process import ProcessAttributesPro
 from multistorageclient.telemetry.attributes.static import StaticAttributesProvider
 from multistorageclient.telemetry.attributes.thread import ThreadAttributesProvider
 
+#: Attributes provider types which map attribute keys to an enum of supported attributes.
+EnumAttributesProviderType = Union[
+    type[HostAttributesProvider], type[ProcessAttributesProvider], type[ThreadAttributesProvider]
+]
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        pytest.param((HostAttributesProvider, "host", "name"), id="host"),
+        pytest.param((ProcessAttributesProvider, "process", "pid"), id="process"),
+        pytest.param((ThreadAttributesProvider, "thread", "native_id"), id="thread"),
+    ],
+)
+def enum_attributes_provider(
+    request: pytest.FixtureRequest,
+) -> tuple[EnumAttributesProviderType, AttributesProvider, str]:
+    """
+    Attributes provider type + an instance of it + the attribute key the instance provides.
+
+    Providers with immutable configurations are built once per session.
+    """
+    attributes_provider_type, attribute_key, attribute_value = request.param
+    return (
+        attributes_provider_type,
+        attributes_provider_type(attributes={attribute_key: attribute_value}),
+        attribute_key,
+    )
+
 
 def test_environment_variables_attributes_provider():
-    environment_variable_key, environment_variable_value = list(os.environ.items())[0]
+    # Environment variables are reset before each test, so this can't be a session fixture.
+    environment_variable_key, environment_variable_value = next(iter(os.environ.items()))
     attribute_key = "attribute"
     attributes = EnvironmentVariablesAttributesProvider(
         attributes={attribute_key: environment_variable_key}
@@ -38,25 +69,25 @@ def test_environment_variables_attributes_provider():
     assert attributes[attribute_key] == environment_variable_value
 
 
-def test_host_attributes_provider():
-    attribute_key = "host"
-    attributes = HostAttributesProvider(attributes={attribute_key: "name"}).attributes()
+def test_enum_attributes_provider(enum_attributes_provider: tuple[EnumAttributesProviderType, AttributesProvider, str]):
+    attributes_provider_type, attributes_provider, attribute_key = enum_attributes_provider
+    attributes = attributes_provider.attributes()
     assert attributes is not None
     assert attribute_key in attributes
     assert attributes[attribute_key] is not None
 
+    # The constructor rejects unsupported attributes, so this one is built inline.
     with pytest.raises(ValueError):
-        HostAttributesProvider(attributes={"unsupported": "unsupported"})
+        attributes_provider_type(attributes={"unsupported": "unsupported"})
 
 
+@pytest.mark.skipif("sha3_256" not in hashlib.algorithms_available, reason="SHA3-256 isn't available.")
 def test_msc_config_attributes_provider():
     client_credential_value = "secret"
     client_credential_value_hash_algorithm = "sha3-256"
-    client_credential_value_hash = hashlib.new(client_credential_value_hash_algorithm)
-    client_credential_value_hash.update(client_credential_value.encode())
     attribute_key = "credentials"
     hashed_attribute_key = "credentials_hash"
-    hashed_attribute_value = client_credential_value_hash.hexdigest()
+    hashed_attribute_value = hashlib.sha3_256(client_credential_value.encode()).hexdigest()
     config_dict_path = "opentelemetry.metrics.exporter.auth.options.client_credential"
     attributes = MSCConfigAttributesProvider(
         attributes={
@@ -78,17 +109,6 @@ def test_msc_config_attributes_provider():
     assert attributes[hashed_attribute_key] == hashed_attribute_value
 
 
-def test_process_attributes_provider():
-    attribute_key = "process"
-    attributes = ProcessAttributesProvider(attributes={attribute_key: "pid"}).attributes()
-    assert attributes is not None
-    assert attribute_key in attributes
-    assert attributes[attribute_key] is not None
-
-    with pytest.raises(ValueError):
-        ProcessAttributesProvider(attributes={"unsupported": "unsupported"})
-
-
 def test_static_attributes_provider():
     attribute_key = "attribute"
     attribute_value = True
@@ -98,30 +118,23 @@ def test_static_attributes_provider():
     assert attributes[attribute_key] == attribute_value
 
 
-def test_thread_attributes_provider():
-    attribute_key = "thread"
-    attributes = ThreadAttributesProvider(attributes={attribute_key: "native_id"}).attributes()
-    assert attributes is not None
-    assert attribute_key in attributes
-    assert attributes[attribute_key] is not None
-
-    with pytest.raises(ValueError):
-        ThreadAttributesProvider(attributes={"unsupported": "unsupported"})
-
-
-def test_collect_attributes():
-    attribute_key_x = "x"
-    attribute_key_y = "y"
-    attribute_value_x = 1
-    attribute_value_y = 1
-    attribute_value_y_overlay = 2
-    attributes_providers = [
-        StaticAttributesProvider(attributes={attribute_key_x: attribute_value_x, attribute_key_y: attribute_value_y}),
-        StaticAttributesProvider(attributes={attribute_key_y: attribute_value_y_overlay}),
-    ]
-    attributes = collect_attributes(attributes_providers=attributes_providers)
-    assert attributes is not None
-    assert attribute_key_x in attributes
-    assert attributes[attribute_key_x] == attribute_value_x
-    assert attribute_key_y in attributes
-    assert attributes[attribute_key_y] == attribute_value_y_overlay
+@pytest.mark.parametrize(
+    argnames=["attributes_providers", "expected_attributes"],
+    argvalues=[
+        pytest.param([], {}, id="empty"),
+        pytest.param([StaticAttributesProvider(attributes={"x": 1})], {"x": 1}, id="single"),
+        pytest.param(
+            [StaticAttributesProvider(attributes={"x": 1}), StaticAttributesProvider(attributes={"y": 2})],
+            {"x": 1, "y": 2},
+            id="disjoint",
+        ),
+        pytest.param(
+            [StaticAttributesProvider(attributes={"x": 1, "y": 1}), StaticAttributesProvider(attributes={"y": 2})],
+            {"x": 1, "y": 2},
+            id="overlapping",
+        ),
+    ],
+)
+def test_collect_attributes(attributes_providers: list[AttributesProvider], expected_attributes: dict):
+    # The latest attributes provider wins for overlapping keys.
+    assert collect_attributes(attributes_providers=attributes_providers) == expected_attributes
@@ -13,8 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
-
 import opentelemetry.sdk.metrics as sdk_metrics
 import opentelemetry.sdk.metrics.export as sdk_metrics_export
 
@@ -24,9 +22,11 @@ from test_multistorageclient.unit.utils.telemetry.metrics.export import InMemory
 
 def test_diperiodic_exporting_metric_reader():
     collect_interval_millis = 1
-    export_interval_millis = 1000
+    export_interval_millis = 50
     # 2 periods of each to avoid race conditions.
     shutdown_timeout_millis = 2 * (collect_interval_millis + export_interval_millis)
+    # Returns as soon as the first export lands. Generous so slow CI runners don't flake.
+    export_wait_timeout_seconds = 5
 
     exporter = InMemoryMetricExporter()
     reader = DiperiodicExportingMetricReader(
@@ -40,7 +40,7 @@ def test_diperiodic_exporting_metric_reader():
 
     # Periodic export.
     gauge.set(1)
-    time.sleep(2)
+    assert exporter.wait_for_export(timeout=export_wait_timeout_seconds)
     metrics_data = exporter.metrics_data()
     assert metrics_data is not None
     assert len(metrics_data.resource_metrics) == 1
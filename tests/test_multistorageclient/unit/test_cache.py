@@ -13,18 +13,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import os
+import pathlib
 import shutil
+import sys
+import tempfile
 import time
 import uuid
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from unittest.mock import MagicMock
+from typing import Any, Optional
 
 import pytest
+import xattr
 
 import test_multistorageclient.unit.utils.tempdatastore as tempdatastore
 from multistorageclient.cache import DEFAULT_CACHE_REFRESH_INTERVAL, CacheBackendFactory
-from multistorageclient.caching.cache_backend import FileSystemBackend
+from multistorageclient.caching.cache_backend import CacheBackend, FileSystemBackend
 from multistorageclient.caching.cache_config import (
     CacheBackendConfig,
     CacheConfig,
@@ -37,29 +43,115 @@ from multistorageclient.providers import (
 )
 
 
+def _create_sparse_file(path: str, size: int) -> str:
+    """
+    Create a sparse file with the given logical size without writing any data.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+    try:
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+    return path
+
+
+#: tmpfs mount for cache test files.
+TMPFS_PATH = "/dev/shm"
+
+
+def _tmpfs_supported() -> bool:
+    """
+    Check if the tmpfs mount can hold cache files, including the extended attributes used for ETags.
+    """
+    if not (sys.platform.startswith("linux") and os.access(TMPFS_PATH, os.W_OK)):
+        return False
+    try:
+        with tempfile.NamedTemporaryFile(dir=TMPFS_PATH) as probe_file:
+            xattr.setxattr(probe_file.name, "user.probe", b"probe")
+        return True
+    except OSError:
+        return False
+
+
+@pytest.fixture(scope="module")
+def tmp_root(tmp_path_factory) -> Iterator[str]:
+    """
+    Root directory for the cache tests' temporary directories.
+
+    The cache tests exercise cache backend logic, not the disk, so use a tmpfs when possible.
+    """
+    if _tmpfs_supported():
+        with tempfile.TemporaryDirectory(dir=TMPFS_PATH, prefix="msc-test-cache-") as root:
+            yield root
+    else:
+        yield str(tmp_path_factory.mktemp("cache"))
+
+
 @pytest.fixture
+def cache_tmp_path(tmp_root) -> Iterator[pathlib.Path]:
+    """
+    Per-test temporary directory under :py:func:`tmp_root`. Removed after each test so tmpfs usage doesn't pile up.
+    """
+    with tempfile.TemporaryDirectory(dir=tmp_root) as path:
+        yield pathlib.Path(path)
+
+
+def _set_cache_file_times(cache_manager: FileSystemBackend, key: str, timestamp: float) -> None:
+    """
+    Set a cached file's access + modification times. Orders cache entries without sleeping between writes.
+    """
+    os.utime(cache_manager._get_cache_file_path(key), (timestamp, timestamp))
+
+
+def _force_refresh_cache(cache_manager: CacheBackend) -> None:
+    """
+    Force a cache refresh (and eviction).
+
+    Only :py:meth:`FileSystemBackend.set` checks the refresh interval, so calling
+    :py:meth:`FileSystemBackend.refresh_cache` directly always refreshes unless another process holds the refresh lock.
+    """
+    assert cache_manager.refresh_cache(), "Cache refresh should acquire the refresh lock"
+
+
+@pytest.fixture(scope="module")
 def profile_name():
     return "test-cache"
 
 
-@pytest.fixture
-def cache_config(tmpdir):
+@pytest.fixture(scope="module")
+def cache_config(tmp_root):
     """Fixture for CacheConfig object."""
-    return CacheConfig(size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=str(tmpdir)))
+    return CacheConfig(
+        size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=tempfile.mkdtemp(dir=tmp_root))
+    )
 
 
 @pytest.fixture
-def cache_config_with_etag(tmpdir):
+def cache_config_with_etag(cache_tmp_path):
     """Fixture for CacheConfig object with etag support enabled."""
-    return CacheConfig(size="10M", use_etag=True, backend=CacheBackendConfig(cache_path=str(tmpdir)))
+    return CacheConfig(size="10M", use_etag=True, backend=CacheBackendConfig(cache_path=str(cache_tmp_path)))
 
 
-@pytest.fixture
-def cache_manager(profile_name, cache_config):
-    """Fixture for CacheManager object."""
+@pytest.fixture(scope="module")
+def shared_cache_manager(profile_name, cache_config):
+    """Fixture for CacheManager object shared across the module. Use :py:func:`cache_manager` in tests."""
     return CacheBackendFactory.create(profile=profile_name, cache_config=cache_config)
 
 
+@pytest.fixture
+def cache_manager(shared_cache_manager):
+    """Fixture for CacheManager object. Resets the shared cache manager before + after each test."""
+    metrics_helper = shared_cache_manager._metrics_helper
+    # Restart the refresh interval like a new cache manager would, so set() doesn't start a background refresh
+    # depending on test order or module run time that races with the cache directory reset below.
+    shared_cache_manager._last_refresh_time = datetime.now()
+    yield shared_cache_manager
+    shared_cache_manager._metrics_helper = metrics_helper
+    shared_cache_manager._last_refresh_time = datetime.now()
+    shutil.rmtree(shared_cache_manager._cache_path)
+    os.makedirs(shared_cache_manager._cache_path)
+
+
 @pytest.fixture
 def cache_manager_with_etag(profile_name, cache_config_with_etag):
     """Fixture for CacheManager object with etag support enabled."""
@@ -71,10 +163,10 @@ def test_cache_config_size_bytes(cache_config):
     assert cache_config.size_bytes() == 10 * 1024 * 1024  # 10 MB
 
 
-def test_cache_manager_read_file(profile_name, tmpdir, cache_manager):
+def test_cache_manager_read_file(cache_tmp_path, cache_manager):
     """Test that CacheManager can read a file from the cache."""
-    file = tmpdir.join(profile_name, "test_file.txt")
-    file.write("cached data")
+    file = cache_tmp_path / "test_file.txt"
+    file.write_text("cached data")
 
     cache_manager.set("bucket/test_file.txt", str(file))
     assert cache_manager.read("bucket/test_file.txt") == b"cached data"
@@ -83,7 +175,7 @@ def test_cache_manager_read_file(profile_name, tmpdir, cache_manager):
     assert cache_manager.read("bucket/test_file.bin") == b"binary data"
 
 
-def test_cache_manager_preserves_directory_structure(profile_name, tmpdir, cache_manager):
+def test_cache_manager_preserves_directory_structure(cache_manager):
     """Test that CacheManager preserves directory structure in the cache."""
     # Create test files in different directories with more diverse paths
 
@@ -105,25 +197,31 @@ def test_cache_manager_preserves_directory_structure(profile_name, tmpdir, cache
     for path, content in files.items():
         cache_manager.set(f"bucket/{test_uuid}/{path}", content.encode())
 
-    # Verify each file exists in cache with correct directory structure and content
-    for path, content in files.items():
-        # Read from cache
-        cached_data = cache_manager.read(f"bucket/{test_uuid}/{path}")
-        assert cached_data == content.encode(), f"Content mismatch for {path}"
+    cache_root = cache_manager._cache_path
 
-        # Verify file exists in cache
-        cache_path = os.path.join(tmpdir, profile_name, cache_manager.get_cache_key(f"bucket/{test_uuid}/{path}"))
-        assert os.path.exists(cache_path), f"File not found in cache: {path}"
-
-    # Get all directories in the cache
-    cache_root = os.path.join(tmpdir, profile_name)
+    # Get all files and directories in the cache in one pass
+    cached_files = {}
     all_dirs = set()
-    for root, dirs, _ in os.walk(cache_root):
+    for root, dirs, file_names in os.walk(cache_root):
         for dir_name in dirs:
             # Skip lock files
             if not dir_name.startswith("."):
                 rel_path = os.path.relpath(os.path.join(root, dir_name), cache_root)
                 all_dirs.add(rel_path)
+        for file_name in file_names:
+            # Skip lock files
+            if not file_name.startswith("."):
+                file_path = os.path.join(root, file_name)
+                with open(file_path, "rb") as f:
+                    cached_files[os.path.relpath(file_path, cache_root)] = f.read()
+
+    # Verify each file exists in cache with correct directory structure and content
+    expected_files = {
+        cache_manager.get_cache_key(f"bucket/{test_uuid}/{path}"): content.encode() for path, content in files.items()
+    }
+    assert cached_files == expected_files, (
+        f"Unexpected files found in cache. Got: {cached_files}, Expected: {expected_files}"
+    )
 
     # Expected directory structure
     expected_dirs = {
@@ -144,15 +242,15 @@ def test_cache_manager_preserves_directory_structure(profile_name, tmpdir, cache
         f"Unexpected directories found in cache. Got: {all_dirs}, Expected: {expected_dirs}"
     )
 
-    # Verify that all files are accessible through the cache manager
-    for path in files.keys():
-        assert cache_manager.contains(f"bucket/{test_uuid}/{path}"), f"Cache manager should contain {path}"
+    # Verify that files are accessible through the cache manager
+    deepest_path = "folder3/folder4/subfolder/deep/file6.txt"
+    assert cache_manager.read(f"bucket/{test_uuid}/{deepest_path}") == files[deepest_path].encode()
 
 
-def test_cache_manager_read_file_with_etag(profile_name, tmpdir, cache_manager_with_etag):
+def test_cache_manager_read_file_with_etag(profile_name, cache_tmp_path, cache_manager_with_etag):
     """Test that CacheManager can read a file from the cache with etag in the key."""
-    file = tmpdir.join(profile_name, "test_file.txt")
-    file.write("cached data")
+    file = cache_tmp_path / profile_name / "test_file.txt"
+    file.write_text("cached data")
 
     test_uuid = str(uuid.uuid4())
     # Test with etag in the key
@@ -166,7 +264,7 @@ def test_cache_manager_read_file_with_etag(profile_name, tmpdir, cache_manager_w
     assert cache_manager_with_etag.read(key_with_etag_bin) == b"binary data"
 
     # Verify that the file is stored with the etag in the path
-    expected_path = os.path.join(tmpdir, profile_name, cache_manager_with_etag.get_cache_key(key_with_etag))
+    expected_path = os.path.join(cache_tmp_path, profile_name, cache_manager_with_etag.get_cache_key(key_with_etag))
     assert os.path.exists(expected_path), f"File should exist at {expected_path}"
 
     # Test that reading without etag returns None
@@ -174,12 +272,12 @@ def test_cache_manager_read_file_with_etag(profile_name, tmpdir, cache_manager_w
     assert cache_manager_with_etag.read(key_without_etag) is None
 
 
-def test_cache_manager_read_delete_file_with_etag(profile_name, tmpdir, cache_manager_with_etag):
+def test_cache_manager_read_delete_file_with_etag(profile_name, cache_tmp_path, cache_manager_with_etag):
     """Test that CacheManager can read and delete a file from the cache with etag in the key."""
 
     test_uuid = str(uuid.uuid4())
-    file = tmpdir.join(profile_name, "test_file.txt")
-    file.write("cached data")
+    file = cache_tmp_path / profile_name / "test_file.txt"
+    file.write_text("cached data")
 
     key_with_etag = f"bucket/{test_uuid}/test_file.txt:etag123"
 
@@ -188,7 +286,8 @@ def test_cache_manager_read_delete_file_with_etag(profile_name, tmpdir, cache_ma
 
     # Verify the lock file is in the same directory as the file
     cache_key = cache_manager_with_etag.get_cache_key(key_with_etag)
-    lock_path = os.path.join(tmpdir, profile_name, os.path.dirname(cache_key), f".{os.path.basename(cache_key)}.lock")
+    cache_path = os.path.join(cache_tmp_path, profile_name, cache_key)
+    lock_path = os.path.join(os.path.dirname(cache_path), f".{os.path.basename(cache_key)}.lock")
     assert os.path.exists(lock_path)
 
     # Verify we can read the file
@@ -198,17 +297,17 @@ def test_cache_manager_read_delete_file_with_etag(profile_name, tmpdir, cache_ma
     cache_manager_with_etag.delete(key_with_etag)
 
     # Verify the file and its lock are deleted
-    assert not os.path.exists(os.path.join(tmpdir, profile_name, cache_key))
+    assert not os.path.exists(cache_path)
     assert not os.path.exists(lock_path)
 
     # Test that reading after delete returns None
     assert cache_manager_with_etag.read(key_with_etag) is None
 
 
-def test_cache_manager_read_delete_file(profile_name, tmpdir, cache_manager):
+def test_cache_manager_read_delete_file(cache_tmp_path, cache_manager):
     """Test that CacheManager can read a file from the cache."""
-    file = tmpdir.join(profile_name, "test_file.txt")
-    file.write("cached data")
+    file = cache_tmp_path / "test_file.txt"
+    file.write_text("cached data")
 
     test_uuid = str(uuid.uuid4())
     key = f"bucket/{test_uuid}/test_file.txt"
@@ -218,212 +317,201 @@ def test_cache_manager_read_delete_file(profile_name, tmpdir, cache_manager):
 
     # Verify the lock file is in the same directory as the file
     cache_key = cache_manager.get_cache_key(key)
-    lock_path = os.path.join(tmpdir, profile_name, os.path.dirname(cache_key), f".{os.path.basename(cache_key)}.lock")
-    assert os.path.exists(lock_path)
+    cache_file_dir = os.path.dirname(os.path.join(cache_manager._cache_path, cache_key))
+    cache_file_names = {os.path.basename(cache_key), f".{os.path.basename(cache_key)}.lock"}
+    assert cache_file_names <= set(os.listdir(cache_file_dir))
 
     assert cache_manager.read(key) == b"cached data"
 
     cache_manager.delete(key)
 
     # Verify the file and its lock are deleted
-    assert not os.path.exists(os.path.join(tmpdir, profile_name, cache_key))
-    assert not os.path.exists(lock_path)
+    assert cache_file_names.isdisjoint(os.listdir(cache_file_dir))
 
 
-def test_cache_manager_open_file(profile_name, tmpdir, cache_manager):
+def test_cache_manager_open_file(cache_tmp_path, cache_manager):
     """Test that CacheManager can open a file from the cache."""
-    file = tmpdir.join(profile_name, "test_file.txt")
-    file.write("cached data")
+    file = cache_tmp_path / "test_file.txt"
+    file.write_text("cached data")
 
     test_uuid = str(uuid.uuid4())
     key = f"bucket/{test_uuid}/test_file.txt"
 
     cache_manager.set(key, str(file))
+    cache_path = os.path.join(cache_manager._cache_path, cache_manager.get_cache_key(key))
 
     with cache_manager.open(key, "r") as result:
         assert result.read() == "cached data"
-        assert result.name == os.path.join(tmpdir, profile_name, cache_manager.get_cache_key(key))
+        assert result.name == cache_path
 
     with cache_manager.open(key, "rb") as result:
         assert result.read() == b"cached data"
-        assert result.name == os.path.join(tmpdir, profile_name, cache_manager.get_cache_key(key))
+        assert result.name == cache_path
 
 
-def test_cache_manager_refresh_cache(tmpdir):
+def test_cache_manager_refresh_cache(cache_tmp_path):
     """Test that cache refresh works correctly."""
     # Use a separate cache directory for this test
-    cache_dir = os.path.join(str(tmpdir), "refresh_test")
+    cache_dir = os.path.join(cache_tmp_path, "refresh_test")
     os.makedirs(cache_dir, exist_ok=True)
 
-    cache_config = CacheConfig(size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=cache_dir))
+    cache_config = CacheConfig(size="1M", use_etag=False, backend=CacheBackendConfig(cache_path=cache_dir))
     cache_manager = CacheBackendFactory.create(profile="refresh_test", cache_config=cache_config)
 
-    data_10mb = b"*" * 10 * 1024 * 1024
-    for i in range(20):
+    # 20 files only just exceed the 1 MB cache, which is enough to trigger an eviction.
+    file_size = 64 * 1024
+    # Keep one bytes source for coverage. Use sparse files for the rest to skip moving them through the page cache.
+    cache_manager.set("bucket/test_0000.bin", b"*" * file_size)
+
+    def set_sparse_file(i: int) -> None:
         file_name = f"bucket/test_{i:04d}.bin"
-        cache_manager.set(file_name, data_10mb)
+        cache_manager.set(file_name, _create_sparse_file(os.path.join(cache_tmp_path, f"test_{i:04d}.bin"), file_size))
 
-    # Force refresh by setting last refresh time to the past
-    cache_manager._last_refresh_time = datetime.now().replace(year=2000)
+    # Sets for distinct keys are independent, so overlap them.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(set_sparse_file, range(1, 20)))
 
-    cache_manager.refresh_cache()
-    assert cache_manager.cache_size() <= 10 * 1024 * 1024
+    _force_refresh_cache(cache_manager)
+    assert cache_manager.cache_size() <= 1 * 1024 * 1024
+    assert not all(cache_manager.contains(f"bucket/test_{i:04d}.bin") for i in range(20)), "Files should be evicted"
+
+
+class _MetricsHelperSpy:
+    """
+    Records the last call to the cache backend's metrics helper.
+    """
 
-    # Clean up
-    shutil.rmtree(cache_dir)
+    last_increase: Optional[dict[str, Any]] = None
 
+    def increase(self, **kwargs: Any) -> None:
+        self.last_increase = kwargs
 
-def test_cache_manager_metrics(profile_name, tmpdir, cache_manager):
-    # Mock the metrics helper in the backend
-    cache_manager._metrics_helper = MagicMock()
+
+def test_cache_manager_metrics(cache_tmp_path, cache_manager):
+    # Spy on the metrics helper in the backend
+    metrics_helper_spy = _MetricsHelperSpy()
+    cache_manager._metrics_helper = metrics_helper_spy
 
     test_uuid = str(uuid.uuid4())
-    file = tmpdir.join(profile_name, "test_file.txt")
-    file.write("cached data")
+    file = cache_tmp_path / "test_file.txt"
+    file.write_text("cached data")
 
     cache_manager.set(f"bucket/{test_uuid}/test_file.txt", str(file))
-    cache_manager._metrics_helper.increase.assert_called_with(operation="SET", success=True)
+    assert metrics_helper_spy.last_increase == {"operation": "SET", "success": True}
 
     cache_manager.read(f"bucket/{test_uuid}/test_file.txt")
-    cache_manager._metrics_helper.increase.assert_called_with(operation="READ", success=True)
+    assert metrics_helper_spy.last_increase == {"operation": "READ", "success": True}
 
     cache_manager.read(f"bucket/{test_uuid}/test_file_not_exist.txt")
-    cache_manager._metrics_helper.increase.assert_called_with(operation="READ", success=False)
+    assert metrics_helper_spy.last_increase == {"operation": "READ", "success": False}
 
     cache_manager.open(f"bucket/{test_uuid}/test_file.txt")
-    cache_manager._metrics_helper.increase.assert_called_with(operation="OPEN", success=True)
+    assert metrics_helper_spy.last_increase == {"operation": "OPEN", "success": True}
 
     cache_manager.open(f"bucket/{test_uuid}/test_file_not_exist.txt")
-    cache_manager._metrics_helper.increase.assert_called_with(operation="OPEN", success=False)
+    assert metrics_helper_spy.last_increase == {"operation": "OPEN", "success": False}
 
 
-@pytest.fixture
-def lru_cache_config(tmpdir):
-    cache_dir = os.path.join(str(tmpdir), "lru_cache")
-    return CacheConfig(
-        size="10M",
-        use_etag=False,
-        eviction_policy=EvictionPolicyConfig(policy="LRU"),
-        backend=CacheBackendConfig(cache_path=cache_dir),
-    )
+#: Cache size in the eviction policy tests. Eviction only depends on relative sizes, so keep it small.
+EVICTION_TEST_CACHE_SIZE = "0.01M"
 
+#: Size of each file in the eviction policy tests. 4 files exceed the ~10 KiB cache.
+EVICTION_TEST_FILE_SIZE = 3 * 1024
+EVICTION_TEST_FILE_BODY = b"*" * EVICTION_TEST_FILE_SIZE
 
-def test_lru_eviction_policy(profile_name, lru_cache_config):
-    # Create the CacheManager with the provided lru_cache_config
-    cache_manager = CacheBackendFactory.create(profile=profile_name, cache_config=lru_cache_config)
 
-    test_uuid = str(uuid.uuid4())
-    # Add files to the cache (each file is 3 MB)
-    cache_manager.set(f"{test_uuid}/file1", b"a" * 3 * 1024 * 1024)  # 3 MB
-    time.sleep(1)
-    cache_manager.set(f"{test_uuid}/file2", b"b" * 3 * 1024 * 1024)  # 3 MB
-    time.sleep(1)
-    cache_manager.set(f"{test_uuid}/file3", b"c" * 3 * 1024 * 1024)  # 3 MB
-    time.sleep(1)
+#: Upper bound on an eviction test's duration. They don't sleep, so taking longer means a regression.
+EVICTION_TEST_TIME_LIMIT_SECONDS = 5
 
-    # Access file1 to make it the most recently used
-    cache_manager.read(f"{test_uuid}/file1")  # force update ts
-    time.sleep(1)
 
-    # Add another file to trigger eviction
-    cache_manager.set(f"{test_uuid}/file4", b"d" * 3 * 1024 * 1024)  # 3 MB
+@pytest.fixture
+def eviction_test_time_limit() -> Callable[[], None]:
+    """
+    Check the test hasn't taken longer than :py:const:`EVICTION_TEST_TIME_LIMIT_SECONDS` so far.
 
-    time.sleep(1)  # Ensure time difference for LRU
-    # Record the current last_refresh_time and set it to past to force refresh
-    old_refresh_time = cache_manager._last_refresh_time
-    cache_manager._last_refresh_time = datetime.now().replace(year=2000)
-    cache_manager.refresh_cache()
-    # Verify that refresh occurred by checking last_refresh_time was updated
-    assert cache_manager._last_refresh_time > old_refresh_time, "Cache refresh should update last_refresh_time"
+    Tests call the check at their end, so an over-limit run fails like any other assertion. It doesn't interrupt
+    a hung test.
+    """
+    start = time.monotonic()
 
-    # Verify that file1 is still in the cache (LRU policy)
-    assert cache_manager.contains(f"{test_uuid}/file1"), "Most recently used file should be kept"
+    def check() -> None:
+        duration = time.monotonic() - start
+        assert duration < EVICTION_TEST_TIME_LIMIT_SECONDS, (
+            f"Eviction test took {duration:.1f}s, limit is {EVICTION_TEST_TIME_LIMIT_SECONDS}s."
+        )
 
-    # Verify that the least recently used file (file2 or file3) has been evicted
-    assert not cache_manager.contains(f"{test_uuid}/file2") or not cache_manager.contains(f"{test_uuid}/file3"), (
-        "Least recently used file should be evicted"
-    )
+    return check
 
 
-@pytest.fixture
-def fifo_cache_config(tmpdir):
-    cache_dir = os.path.join(str(tmpdir), "fifo_cache")
-    return CacheConfig(
-        size="10M",
+def _create_eviction_cache_manager(profile_name: str, cache_tmp_path: pathlib.Path, policy: str) -> FileSystemBackend:
+    """
+    Create a :py:const:`EVICTION_TEST_CACHE_SIZE` cache manager with the given eviction policy.
+    """
+    cache_config = CacheConfig(
+        size=EVICTION_TEST_CACHE_SIZE,
         use_etag=False,
-        eviction_policy=EvictionPolicyConfig(policy="FIFO"),
-        backend=CacheBackendConfig(cache_path=cache_dir),
+        eviction_policy=EvictionPolicyConfig(policy=policy),
+        backend=CacheBackendConfig(cache_path=os.path.join(cache_tmp_path, f"{policy.lower()}_cache")),
     )
+    cache_manager = CacheBackendFactory.create(profile=profile_name, cache_config=cache_config)
+    assert isinstance(cache_manager, FileSystemBackend)
+    return cache_manager
 
 
-def test_fifo_eviction_policy(profile_name, fifo_cache_config):
-    # Create the CacheManager with the provided fifo_cache_config
-    cache_manager = CacheBackendFactory.create(profile=profile_name, cache_config=fifo_cache_config)
-
-    test_uuid = str(uuid.uuid4())
-    # Add files to the cache (each file is 3 MB)
-    cache_manager.set(f"{test_uuid}/file1", b"a" * 3 * 1024 * 1024)  # 3 MB - First in
-    time.sleep(1)  # Ensure files have different timestamps
-    cache_manager.set(f"{test_uuid}/file2", b"b" * 3 * 1024 * 1024)  # 3 MB - Second in
-    time.sleep(1)  # Ensure files have different timestamps
-    cache_manager.set(f"{test_uuid}/file3", b"c" * 3 * 1024 * 1024)  # 3 MB - Third in
-
-    # Access files in different order to verify FIFO is independent of access patterns
-    cache_manager.read(f"{test_uuid}/file3")  # Access the newest file
-    cache_manager.read(f"{test_uuid}/file2")  # Access the middle file
-    cache_manager.read(f"{test_uuid}/file1")  # Access the oldest file
-
-    # Add another file to trigger eviction
-    cache_manager.set(f"{test_uuid}/file4", b"d" * 3 * 1024 * 1024)  # 3 MB - Fourth in
+def _add_backdated_files(cache_manager: FileSystemBackend, keys: list[str]) -> None:
+    """
+    Add files to the cache with increasing timestamps in the past.
 
-    # Force refresh to trigger eviction
-    old_refresh_time = cache_manager._last_refresh_time
-    cache_manager._last_refresh_time = datetime.now().replace(year=2000)
-    cache_manager.refresh_cache()
-    assert cache_manager._last_refresh_time > old_refresh_time, "Cache refresh should update last_refresh_time"
+    Later reads + writes are then unambiguously newer without sleeping between them.
+    """
+    for key in keys:
+        cache_manager.set(key, EVICTION_TEST_FILE_BODY)
+    # The timestamps, not the set order, determine the eviction order.
+    base_timestamp = time.time() - 60
+    for i, key in enumerate(keys, start=1):
+        _set_cache_file_times(cache_manager, key, base_timestamp + i)
 
-    # Verify that file1 (first in) has been evicted
-    assert not cache_manager.contains(f"{test_uuid}/file1"), "First file in should be evicted (FIFO)"
 
-    # Verify that later files are still in the cache
-    assert cache_manager.contains(f"{test_uuid}/file2"), "Second file in should be kept"
-    assert cache_manager.contains(f"{test_uuid}/file3"), "Third file in should be kept"
-    assert cache_manager.contains(f"{test_uuid}/file4"), "Newly added file should be in the cache"
+@pytest.mark.parametrize(
+    argnames=["policy", "read_files", "evicted_files"],
+    argvalues=[
+        # Reading file1 makes it the most recently used, so file2 then file3 are evicted.
+        pytest.param("LRU", ["file1"], ["file2", "file3"], id="lru"),
+        # Reads don't affect the insertion order, so file1 then file2 are evicted.
+        pytest.param("FIFO", ["file3", "file2", "file1"], ["file1", "file2"], id="fifo"),
+    ],
+)
+def test_eviction_policy(profile_name, cache_tmp_path, eviction_test_time_limit, policy, read_files, evicted_files):
+    cache_manager = _create_eviction_cache_manager(profile_name, cache_tmp_path, policy)
 
-    # Add one more file to verify FIFO continues to work
-    cache_manager.set(f"{test_uuid}/file5", b"e" * 3 * 1024 * 1024)  # 3 MB - Fifth in
+    test_uuid = str(uuid.uuid4())
+    cached_files = ["file1", "file2", "file3"]
+    _add_backdated_files(cache_manager, [f"{test_uuid}/{file}" for file in cached_files])
 
-    # Force refresh to trigger eviction
-    old_refresh_time = cache_manager._last_refresh_time
-    cache_manager._last_refresh_time = datetime.now().replace(year=2000)
-    cache_manager.refresh_cache()
-    assert cache_manager._last_refresh_time > old_refresh_time, "Cache refresh should update last_refresh_time"
+    for file in read_files:
+        assert cache_manager.read(f"{test_uuid}/{file}") is not None
 
-    # Verify that file2 (now the oldest) is evicted
-    assert not cache_manager.contains(f"{test_uuid}/file2"), "Second file in should now be evicted"
-    assert cache_manager.contains(f"{test_uuid}/file3"), "Third file in should still be kept"
-    assert cache_manager.contains(f"{test_uuid}/file4"), "Fourth file in should still be kept"
-    assert cache_manager.contains(f"{test_uuid}/file5"), "Most recently added file should be in the cache"
+    # Add one file at a time to trigger an eviction each.
+    for new_file, evicted_file in zip(["file4", "file5"], evicted_files):
+        cache_manager.set(f"{test_uuid}/{new_file}", EVICTION_TEST_FILE_BODY)
+        cached_files.append(new_file)
+        _force_refresh_cache(cache_manager)
 
+        assert not cache_manager.contains(f"{test_uuid}/{evicted_file}"), f"{evicted_file} should be evicted"
+        cached_files.remove(evicted_file)
+        for file in cached_files:
+            assert cache_manager.contains(f"{test_uuid}/{file}"), f"{file} should be kept"
 
-@pytest.fixture
-def random_cache_config(tmpdir):
-    cache_dir = os.path.join(str(tmpdir), "random_cache")
-    return CacheConfig(
-        size="10M",
-        use_etag=False,
-        eviction_policy=EvictionPolicyConfig(policy="RANDOM"),
-        backend=CacheBackendConfig(cache_path=cache_dir),
-    )
+    eviction_test_time_limit()
 
 
-def test_random_eviction_policy(profile_name, random_cache_config):
+def test_random_eviction_policy(profile_name, cache_tmp_path, eviction_test_time_limit):
     """Test the random eviction policy of the cache manager.
 
     This test verifies that the cache manager correctly implements random eviction when the cache is full.
     The test follows these steps:
-    1. Creates a cache with a 10MB limit
-    2. Adds three files of 3MB each (total 9MB)
+    1. Creates a cache with a ~10KiB limit
+    2. Adds three files of 3KiB each (total 9KiB)
     3. Adds a fourth file to trigger eviction
     4. Verifies that:
        - Exactly one file is evicted
@@ -436,22 +524,14 @@ def test_random_eviction_policy(profile_name, random_cache_config):
     - Cache operations maintain consistency
 
     :param profile_name: The name of the cache profile to use
-    :param random_cache_config: Cache configuration with random eviction policy
+    :param cache_tmp_path: Temporary directory for the cache
+    :param eviction_test_time_limit: Check the test's duration is within the eviction test time limit
     """
-    # Clean the entire cache directory
-    cache_dir = random_cache_config.backend.cache_path
-    if os.path.exists(cache_dir):
-        shutil.rmtree(cache_dir)
-    os.makedirs(cache_dir)
-
-    # Create the CacheManager with the provided random_cache_config
-    cache_manager = CacheBackendFactory.create(profile=profile_name, cache_config=random_cache_config)
+    cache_manager = _create_eviction_cache_manager(profile_name, cache_tmp_path, "RANDOM")
 
     test_uuid = str(uuid.uuid4())
-    # Add files to the cache (each file is 3 MB)
-    cache_manager.set(f"{test_uuid}/file1", b"a" * 3 * 1024 * 1024)  # 3 MB
-    cache_manager.set(f"{test_uuid}/file2", b"b" * 3 * 1024 * 1024)  # 3 MB
-    cache_manager.set(f"{test_uuid}/file3", b"c" * 3 * 1024 * 1024)  # 3 MB
+    # Backdate the initial files so the file added later is unambiguously the newest.
+    _add_backdated_files(cache_manager, [f"{test_uuid}/file{i}" for i in range(1, 4)])
 
     # Verify initial state
     assert cache_manager.contains(f"{test_uuid}/file1")
@@ -462,11 +542,10 @@ def test_random_eviction_policy(profile_name, random_cache_config):
     cache_manager.refresh_cache()
 
     # Add another file to trigger eviction
-    cache_manager.set(f"{test_uuid}/file4", b"d" * 3 * 1024 * 1024)  # 3 MB
+    cache_manager.set(f"{test_uuid}/file4", EVICTION_TEST_FILE_BODY)
 
-    # Force refresh to trigger eviction by setting last refresh time to the past
-    cache_manager._last_refresh_time = datetime.now().replace(year=2000)
-    cache_manager.refresh_cache()
+    # Force refresh to trigger eviction
+    _force_refresh_cache(cache_manager)
 
     # Verify that exactly one file was evicted (could be any of the files)
     all_files = [f"{test_uuid}/file1", f"{test_uuid}/file2", f"{test_uuid}/file3", f"{test_uuid}/file4"]
@@ -480,7 +559,9 @@ def test_random_eviction_policy(profile_name, random_cache_config):
             data = cache_manager.read(f)
             if data is not None:  # Handle potential None return from read()
                 total_size += len(data)
-    assert total_size <= 10 * 1024 * 1024, "Total cache size should not exceed 10MB"
+    assert total_size <= cache_manager.get_max_cache_size(), "Total cache size should not exceed the cache size"
+
+    eviction_test_time_limit()
 
 
 def verify_cache_operations(cache_manager):
@@ -501,15 +582,15 @@ def verify_cache_operations(cache_manager):
     assert cache_manager.contains(f"{test_uuid}/test_file3:etag3"), "Newly added file should be in the cache"
 
 
-def create_legacy_cache_config(profile_config, tmpdir):
+def create_legacy_cache_config(profile_config, cache_tmp_path):
     """Helper function to create legacy cache config."""
     return {
         "profiles": {"s3-local": profile_config},
-        "cache": {"size_mb": 10, "use_etag": False, "location": str(tmpdir), "eviction_policy": "fifo"},
+        "cache": {"size_mb": 10, "use_etag": False, "location": str(cache_tmp_path), "eviction_policy": "fifo"},
     }
 
 
-def create_new_cache_config(profile_config, tmpdir):
+def create_new_cache_config(profile_config, cache_tmp_path):
     """Helper function to create new cache config."""
     return {
         "profiles": {"s3-local": profile_config},
@@ -517,12 +598,12 @@ def create_new_cache_config(profile_config, tmpdir):
             "size": "10M",
             "use_etag": False,
             "eviction_policy": {"policy": "random", "refresh_interval": 300},
-            "cache_backend": {"cache_path": str(tmpdir)},
+            "cache_backend": {"cache_path": str(cache_tmp_path)},
         },
     }
 
 
-def create_mixed_cache_config(profile_config, tmpdir):
+def create_mixed_cache_config(profile_config, cache_tmp_path):
     """Helper function to create mixed cache config."""
     return {
         "profiles": {"s3-local": profile_config},
@@ -530,51 +611,61 @@ def create_mixed_cache_config(profile_config, tmpdir):
             "size_mb": 10,
             "use_etag": False,
             "eviction_policy": {"policy": "random", "refresh_interval": 300},
-            "cache_backend": {"cache_path": str(tmpdir)},
+            "cache_backend": {"cache_path": str(cache_tmp_path)},
         },
     }
 
 
-def create_incorrect_size_cache_config(profile_config, tmpdir):
+def create_incorrect_size_cache_config(profile_config, cache_tmp_path):
     """Helper function to create incorrect size cache config."""
     return {"profiles": {"s3-local": profile_config}, "cache": {"size": "one-thousand-gigabytes"}}
 
 
+@pytest.fixture(scope="module")
+def temp_s3_bucket() -> Iterator[tempdatastore.TemporaryAWSS3Bucket]:
+    """
+    Temporary S3 bucket shared across the module.
+
+    The filesystem cache backends under test never write to it, so tests can share it.
+    """
+    with tempdatastore.TemporaryAWSS3Bucket() as temp_store:
+        yield temp_store
+
+
 @pytest.mark.parametrize(
-    argnames=["temp_data_store_type", "config_creator"],
+    argnames=["config_creator"],
     argvalues=[
-        [tempdatastore.TemporaryAWSS3Bucket, create_legacy_cache_config],
-        [tempdatastore.TemporaryAWSS3Bucket, create_new_cache_config],
+        [create_legacy_cache_config],
+        [create_new_cache_config],
     ],
     ids=["legacy_config", "new_config"],
 )
-def test_storage_provider_cache_configs(config_creator, temp_data_store_type, tmpdir):
+def test_storage_provider_cache_configs(config_creator, temp_s3_bucket, cache_tmp_path):
     """Test that both legacy and new cache config formats work correctly."""
-    with temp_data_store_type() as temp_store:
-        config_dict = config_creator(temp_store.profile_config_dict(), tmpdir)
-        if config_creator == create_legacy_cache_config:
-            with pytest.raises(RuntimeError, match="Failed to validate the config file"):
-                StorageClientConfig.from_dict(config_dict)
-        else:
-            storage_config = StorageClientConfig.from_dict(config_dict)
-            real_storage_provider = storage_config.storage_provider
-            for obj in real_storage_provider.list_objects(prefix="test_"):
-                real_storage_provider.delete_object(obj.key)
-            cache_manager = storage_config.cache_manager
-            verify_cache_operations(cache_manager)
+    config_dict = config_creator(temp_s3_bucket.profile_config_dict(), cache_tmp_path)
+    if config_creator == create_legacy_cache_config:
+        with pytest.raises(RuntimeError, match="Failed to validate the config file"):
+            StorageClientConfig.from_dict(config_dict)
+    else:
+        storage_config = StorageClientConfig.from_dict(config_dict)
+        cache_manager = storage_config.cache_manager
+        verify_cache_operations(cache_manager)
+
+
+#: S3 profile config for tests where config validation fails before the storage provider is used.
+#: These don't need a temporary bucket.
+UNUSED_S3_PROFILE_CONFIG = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket"}}}
 
 
 @pytest.mark.parametrize(
-    argnames=["temp_data_store_type", "config_creator", "expected_error", "error_message"],
+    argnames=["config_creator", "expected_error", "error_message"],
     argvalues=[
         [
-            tempdatastore.TemporaryAWSS3Bucket,
             create_mixed_cache_config,
             ValueError,
             "The 'size_mb' and 'location' properties are no longer supported",
         ],
         [
-            tempdatastore.TemporaryAWSS3Bucket,
             create_incorrect_size_cache_config,
             RuntimeError,
             "Failed to validate the config file",
@@ -582,9 +673,7 @@ def test_storage_provider_cache_configs(config_creator, temp_data_store_type, tm
     ],
     ids=["mixed_config", "incorrect_size"],
 )
-def test_storage_provider_invalid_cache_configs(
-    config_creator, temp_data_store_type, expected_error, error_message, tmpdir
-):
+def test_storage_provider_invalid_cache_configs(config_creator, expected_error, error_message, cache_tmp_path):
     """
     Test that invalid cache configurations raise appropriate errors.
 
@@ -592,14 +681,13 @@ def test_storage_provider_invalid_cache_configs(
     1. Mixing old and new cache config formats raises a ValueError
     2. Using an incorrect size format raises a RuntimeError
     """
-    with temp_data_store_type() as temp_store:
-        config_dict = config_creator(temp_store.profile_config_dict(), tmpdir)
-        with pytest.raises(expected_error, match=error_message):
-            StorageClientConfig.from_dict(config_dict)
+    config_dict = config_creator(UNUSED_S3_PROFILE_CONFIG, cache_tmp_path)
+    with pytest.raises(expected_error, match=error_message):
+        StorageClientConfig.from_dict(config_dict)
 
 
 @pytest.fixture
-def storage_provider_empty_cache_config(tmpdir):
+def storage_provider_empty_cache_config(cache_tmp_path):
     """
     New cache config format
     """
@@ -611,23 +699,16 @@ def storage_provider_empty_cache_config(tmpdir):
     return _config_builder
 
 
-@pytest.mark.parametrize(
-    argnames=["temp_data_store_type"],
-    argvalues=[
-        [tempdatastore.TemporaryAWSS3Bucket],
-    ],
-)
-def test_storage_provider_empty_cache_config(storage_provider_empty_cache_config, temp_data_store_type):
-    with temp_data_store_type() as temp_store:
-        config_dict = storage_provider_empty_cache_config(temp_store.profile_config_dict())
-        with pytest.raises(RuntimeError) as exc_info:
-            StorageClientConfig.from_dict(config_dict)
-        assert "Failed to validate the config file" in str(exc_info.value)
-        assert "'eviction_policy' is a required property" in str(exc_info.value)
+def test_storage_provider_empty_cache_config(storage_provider_empty_cache_config):
+    config_dict = storage_provider_empty_cache_config(UNUSED_S3_PROFILE_CONFIG)
+    with pytest.raises(RuntimeError) as exc_info:
+        StorageClientConfig.from_dict(config_dict)
+    assert "Failed to validate the config file" in str(exc_info.value)
+    assert "'eviction_policy' is a required property" in str(exc_info.value)
 
 
 @pytest.fixture
-def storage_provider_partial_cache_config(tmpdir):
+def storage_provider_partial_cache_config(cache_tmp_path):
     """
     New cache config format
     """
@@ -642,35 +723,23 @@ def storage_provider_partial_cache_config(tmpdir):
     return _config_builder
 
 
-@pytest.mark.parametrize(
-    argnames=["temp_data_store_type"],
-    argvalues=[
-        [tempdatastore.TemporaryAWSS3Bucket],
-    ],
-)
-def test_storage_provider_partial_cache_config(storage_provider_partial_cache_config, temp_data_store_type):
-    with temp_data_store_type() as temp_store:
-        config_dict = storage_provider_partial_cache_config(temp_store.profile_config_dict())
-        storage_config = StorageClientConfig.from_dict(config_dict)
-        real_storage_provider = storage_config.storage_provider
-        cache_backend = storage_config.cache_manager
-
-        # Clean up any existing objects in the bucket with test prefix
-        for obj in real_storage_provider.list_objects(prefix="test_"):
-            real_storage_provider.delete_object(obj.key)
+def test_storage_provider_partial_cache_config(storage_provider_partial_cache_config, temp_s3_bucket):
+    config_dict = storage_provider_partial_cache_config(temp_s3_bucket.profile_config_dict())
+    storage_config = StorageClientConfig.from_dict(config_dict)
+    cache_backend = storage_config.cache_manager
 
-        # Access the CacheManager
-        cache_manager = storage_config.cache_manager
-        verify_cache_operations(cache_manager)
+    # Access the CacheManager
+    cache_manager = storage_config.cache_manager
+    verify_cache_operations(cache_manager)
 
-        cache_config = storage_config.cache_config
-        assert cache_config is not None
-        assert cache_config.size == "100M"
-        assert cache_config.backend.cache_path is not None and isinstance(cache_config.backend.cache_path, str)
-        assert cache_config.eviction_policy.policy == "fifo"
-        assert cache_config.eviction_policy.refresh_interval == DEFAULT_CACHE_REFRESH_INTERVAL
-        assert cache_config.use_etag
-        assert isinstance(cache_backend, FileSystemBackend)
+    cache_config = storage_config.cache_config
+    assert cache_config is not None
+    assert cache_config.size == "100M"
+    assert cache_config.backend.cache_path is not None and isinstance(cache_config.backend.cache_path, str)
+    assert cache_config.eviction_policy.policy == "fifo"
+    assert cache_config.eviction_policy.refresh_interval == DEFAULT_CACHE_REFRESH_INTERVAL
+    assert cache_config.use_etag
+    assert isinstance(cache_backend, FileSystemBackend)
 
 
 @pytest.mark.parametrize(
@@ -718,8 +787,8 @@ def test_storage_provider_backend_requires_s3_provider(temp_data_store_type, exp
 
 
 @pytest.fixture
-def no_eviction_cache_config(tmpdir):
-    cache_dir = os.path.join(str(tmpdir), "no_eviction_cache")
+def no_eviction_cache_config(cache_tmp_path):
+    cache_dir = os.path.join(cache_tmp_path, "no_eviction_cache")
     return CacheConfig(
         size="3M",
         use_etag=False,
@@ -774,9 +843,8 @@ def test_no_eviction_policy(profile_name, no_eviction_cache_config):
     lock_file_path = os.path.join(cache_dir, ".cache_refresh.lock")
     assert not os.path.exists(lock_file_path), "No lock file should be created for NONE policy"
 
-    # Force refresh to trigger eviction by setting last refresh time to the past
-    cache_manager._last_refresh_time = datetime.now().replace(year=2000)
-    cache_manager.refresh_cache()
+    # Force refresh to trigger eviction
+    _force_refresh_cache(cache_manager)
 
     # Verify all 5 files are still in cache after refresh
     for i in range(1, 6):
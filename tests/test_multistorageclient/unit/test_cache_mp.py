@@ -13,11 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import multiprocessing
-import os
+import multiprocessing.synchronize
 import random
-import tempfile
-import time
+from typing import Optional
 from unittest.mock import patch
 
 import pytest
@@ -25,90 +25,129 @@ import pytest
 from multistorageclient.cache import CacheBackendFactory
 from multistorageclient.caching.cache_config import CacheBackendConfig, CacheConfig
 
+# Each test starts several worker processes.
+# Run them on the same xdist worker (with ``--dist loadgroup``) so they don't oversubscribe the CPUs together.
+pytestmark = pytest.mark.xdist_group(name="multiprocessing_cache")
 
-def worker_write_read(cache_dir, keys, data, barrier, result_queue):
+#: Payload for each key in the write + read test.
+WRITE_READ_TEST_DATA = b"*" * 1 * 1024 * 1024
+
+#: Payload for each key in the single refresh test. Eviction is stubbed out there, so the size doesn't matter.
+SINGLE_REFRESH_TEST_DATA = b"*" * 256 * 1024
+
+#: Barrier shared by the worker processes. Set by :py:func:`init_worker`.
+#:
+#: Synchronization primitives can only be shared with processes on creation, not as task arguments.
+barrier: Optional[multiprocessing.synchronize.Barrier] = None
+
+
+def init_worker(worker_barrier: multiprocessing.synchronize.Barrier) -> None:
+    """
+    Worker process initializer.
+    """
+    global barrier
+    barrier = worker_barrier
+
+
+def get_barrier() -> multiprocessing.synchronize.Barrier:
+    """
+    Get the barrier shared by the worker processes. Only valid in processes set up by :py:func:`init_worker`.
+    """
+    assert barrier is not None, "Worker process wasn't initialized with init_worker"
+    return barrier
+
+
+def run_workers(fn, num_procs, *args):
+    """
+    Run ``fn(*args)`` once in each of ``num_procs`` worker processes which share a barrier, and return the results.
+    """
+    # Create a barrier that will block until all the processes reach it
+    worker_barrier = multiprocessing.Barrier(num_procs, timeout=60)
+
+    # One worker per call since each call blocks on the barrier until all the others reach it
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_procs, initializer=init_worker, initargs=(worker_barrier,)
+    ) as executor:
+        futures = [executor.submit(fn, *args) for _ in range(num_procs)]
+        done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+        for future in done:
+            if future.exception() is not None:
+                # Release the workers waiting on the barrier instead of letting them time out, then raise the error
+                worker_barrier.abort()
+                future.result()
+        return [future.result() for future in futures]
+
+
+def worker_write_read(cache_config, keys, data):
     """
     Worker function that use CacheManager to write and read data at random order.
     """
-    try:
-        cache_config = CacheConfig(size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=cache_dir))
-        cache_manager = CacheBackendFactory.create(profile="test", cache_config=cache_config)
+    worker_barrier = get_barrier()
+    cache_manager = CacheBackendFactory.create(profile="test", cache_config=cache_config)
 
-        # Synchronize all worker processes at this point
-        barrier.wait()
+    # Synchronize all worker processes at this point
+    worker_barrier.wait()
 
-        # Write the files at random
-        random.shuffle(keys)
-        for key in keys:
-            cache_manager.set(key, data)
+    # Write the files at random
+    random.shuffle(keys)
+    for key in keys:
+        cache_manager.set(key, data)
 
-        # Read the files at random
-        random.shuffle(keys)
-        for key in keys:
+    # Read or open the files at random, alternating between both
+    random.shuffle(keys)
+    for i, key in enumerate(keys):
+        if i % 2 == 0:
             assert data == cache_manager.read(key)
-
-        # Open the files at random
-        random.shuffle(keys)
-        for key in keys:
+        else:
             fp = cache_manager.open(key, "rb")
             assert fp is not None
             assert data == fp.read()
             fp.close()
 
-        # Synchronize all worker processes at this point
-        barrier.wait()
-
-        cache_manager.refresh_cache()
+    # Synchronize all worker processes at this point
+    worker_barrier.wait()
 
-        result_queue.put(True)
-    except Exception as e:
-        import traceback
+    cache_manager.refresh_cache()
 
-        traceback.print_exc()
-        result_queue.put(e)
 
-
-def worker_write_refresh(cache_dir, keys, data, barrier, return_dict, result_queue):
+def worker_write_refresh(cache_config, keys, data):
     """
     Worker function that use CacheManager to write and read data at random order.
     """
-    try:
-        cache_config = CacheConfig(size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=cache_dir))
-        cache_manager = CacheBackendFactory.create(profile="test", cache_config=cache_config)
+    worker_barrier = get_barrier()
+    cache_manager = CacheBackendFactory.create(profile="test", cache_config=cache_config)
 
-        # Synchronize all worker processes at this point
-        barrier.wait()
+    # Synchronize all worker processes at this point
+    worker_barrier.wait()
 
-        # Write the files at random
-        random.shuffle(keys)
-        for key in keys:
-            cache_manager.set(key, data)
+    # Write the files at random
+    random.shuffle(keys)
+    for key in keys:
+        cache_manager.set(key, data)
 
-        # Synchronize all worker processes at this point
-        barrier.wait()
+    # Synchronize all worker processes at this point
+    worker_barrier.wait()
 
-        # Refresh the cache and verify the size
-        with patch(
-            "multistorageclient.caching.cache_backend.FileSystemBackend.evict_files", new=lambda self: time.sleep(5)
-        ):
-            cache_refreshed = cache_manager.refresh_cache()
+    # Refresh the cache. Whichever process acquires the refresh lock holds it until every other process tried to refresh
+    with patch(
+        "multistorageclient.caching.cache_backend.FileSystemBackend.evict_files", new=lambda self: worker_barrier.wait()
+    ):
+        cache_refreshed = cache_manager.refresh_cache()
 
-        return_dict[os.getpid()] = cache_refreshed
-        result_queue.put(True)
-    except Exception as e:
-        import traceback
+    if not cache_refreshed:
+        worker_barrier.wait()
 
-        traceback.print_exc()
-        result_queue.put(e)
+    return cache_refreshed
 
 
 @pytest.fixture
-def cache_dir():
+def cache_dir(tmp_path):
     """
     Pytest fixture to create a temporary cache directory.
+
+    Uses pytest's temporary directories, which are cleaned up in bulk on later runs instead of after each test.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path)
 
 
 def test_multiprocessing_cache_manager(cache_dir):
@@ -118,33 +157,13 @@ def test_multiprocessing_cache_manager(cache_dir):
     num_procs = 8
     max_cache_size = num_procs * 1024 * 1024
     keys = [f"file-{i:04d}.bin" for i in range(num_procs)]
-    test_data = b"*" * 1 * 1024 * 1024
-
-    # Queue for capturing the success or failure of each process
-    result_queue = multiprocessing.Queue()
-
-    # Create a barrier that will block until all the processes reach it
-    barrier = multiprocessing.Barrier(num_procs, timeout=60)
-
-    # Create multiple processes for testing
-    processes = []
-    for _ in range(num_procs):
-        p = multiprocessing.Process(target=worker_write_read, args=(cache_dir, keys, test_data, barrier, result_queue))
-        processes.append(p)
-        p.start()
-
-    # Wait for all writer processes to finish
-    for p in processes:
-        p.join()
+    test_data = WRITE_READ_TEST_DATA
+    cache_config = CacheConfig(size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=cache_dir))
 
-    # Check the results from the queue for reader processes
-    while not result_queue.empty():
-        result = result_queue.get()
-        if isinstance(result, Exception):
-            pytest.fail(f"Worker process failed with error: {result}")
+    # Worker process errors are raised here
+    run_workers(worker_write_read, num_procs, cache_config, keys, test_data)
 
     # Check the final cache size
-    cache_config = CacheConfig(size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=cache_dir))
     cache_manager = CacheBackendFactory.create(profile="test", cache_config=cache_config)
     assert cache_manager.cache_size() <= max_cache_size
 
@@ -152,36 +171,11 @@ def test_multiprocessing_cache_manager(cache_dir):
 def test_multiprocessing_cache_manager_single_refresh(cache_dir):
     num_procs = 8
     keys = [f"file-{i:04d}.bin" for i in range(num_procs * 10)]
-    test_data = b"*" * 10 * 1024 * 1024
-
-    # Shared dictionary for collecting results from worker processes
-    manager = multiprocessing.Manager()
-    return_dict = manager.dict()
-
-    # Queue for capturing the success or failure of each process
-    result_queue = multiprocessing.Queue()
+    test_data = SINGLE_REFRESH_TEST_DATA
+    cache_config = CacheConfig(size="10M", use_etag=False, backend=CacheBackendConfig(cache_path=cache_dir))
 
-    # Create a barrier that will block until all the processes reach it
-    barrier = multiprocessing.Barrier(num_procs, timeout=60)
-
-    # Create multiple processes for testing
-    processes = []
-    for _ in range(num_procs):
-        p = multiprocessing.Process(
-            target=worker_write_refresh, args=(cache_dir, keys, test_data, barrier, return_dict, result_queue)
-        )
-        processes.append(p)
-        p.start()
-
-    # Wait for all writer processes to finish
-    for p in processes:
-        p.join()
-
-    # Check the results from the queue for reader processes
-    while not result_queue.empty():
-        result = result_queue.get()
-        if isinstance(result, Exception):
-            pytest.fail(f"Worker process failed with error: {result}")
+    # Worker process errors are raised here
+    cache_refreshed = run_workers(worker_write_refresh, num_procs, cache_config, keys, test_data)
 
     # Verify only one process refreshed the cache
-    assert len([d for d in return_dict.values() if d is True]) == 1
+    assert cache_refreshed.count(True) == 1
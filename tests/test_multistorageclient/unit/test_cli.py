@@ -21,6 +21,7 @@ from pathlib import Path
 import pytest
 
 import multistorageclient as msc
+from multistorageclient.commands.cli.main import main
 
 
 @pytest.fixture
@@ -31,40 +32,70 @@ def run_cli():
 
     def _run_cli(*args, expected_return_code=0):
         cmd = [sys.executable, "-m", "multistorageclient.commands.cli.main"] + list(args)
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Capture bytes and decode once the process exits
+        result = subprocess.run(cmd, capture_output=True)
+        stdout, stderr = result.stdout.decode(), result.stderr.decode()
 
         # Print output if return code doesn't match expected
         if result.returncode != expected_return_code:
             print(f"Expected return code {expected_return_code}, got {result.returncode}")
-            print(f"STDOUT: {result.stdout}")
-            print(f"STDERR: {result.stderr}")
+            print(f"STDOUT: {stdout}")
+            print(f"STDERR: {stderr}")
 
         assert result.returncode == expected_return_code
-        return result.stdout, result.stderr
+        return stdout, stderr
 
     return _run_cli
 
 
-def test_version_command(run_cli):
-    stdout, stderr = run_cli("--version")
+@pytest.fixture
+def run_cli_in_process(monkeypatch, capsys):
+    """
+    Run the CLI in the test process with the given arguments.
+
+    Skips interpreter startup and imports. Use :py:func:`run_cli` for commands that need process isolation.
+    """
+
+    def _run_cli(*args, expected_return_code=0):
+        monkeypatch.setattr(sys, "argv", ["msc"] + list(args))
+        try:
+            return_code = main()
+        except SystemExit as e:
+            return_code = e.code
+        result = capsys.readouterr()
+
+        # Print output if return code doesn't match expected
+        if return_code != expected_return_code:
+            print(f"Expected return code {expected_return_code}, got {return_code}")
+            print(f"STDOUT: {result.out}")
+            print(f"STDERR: {result.err}")
+
+        assert return_code == expected_return_code
+        return result.out, result.err
+
+    return _run_cli
+
+
+def test_version_command(run_cli_in_process):
+    stdout, stderr = run_cli_in_process("--version")
     assert f"msc-cli/{msc.__version__}" in stdout
     assert "Python" in stdout
 
 
-def test_unknown_command(run_cli):
-    stdout, stderr = run_cli("unknown_command", expected_return_code=1)
+def test_unknown_command(run_cli_in_process):
+    stdout, stderr = run_cli_in_process("unknown_command", expected_return_code=1)
     assert "Unknown command: unknown_command" in stdout
     assert "Run 'msc help'" in stdout
 
 
-def test_help_command(run_cli):
-    stdout, stderr = run_cli("help")
+def test_help_command(run_cli_in_process):
+    stdout, stderr = run_cli_in_process("help")
     assert "commands:" in stdout
     assert "help" in stdout
 
 
-def test_sync_help_command(run_cli):
-    stdout, stderr = run_cli("help", "sync")
+def test_sync_help_command(run_cli_in_process):
+    stdout, stderr = run_cli_in_process("help", "sync")
     assert "Synchronize files" in stdout
     assert "--delete-unmatched-files" in stdout
     assert "--verbose" in stdout
@@ -13,16 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Optional
+from typing import IO, Optional, Union
 
+from multistorageclient.providers.base import BaseStorageProvider
 from multistorageclient.types import (
+    AWARE_DATETIME_MIN,
     Credentials,
     CredentialsProvider,
     MetadataProvider,
     ObjectMetadata,
     ProviderBundle,
+    Range,
     StorageProviderConfig,
 )
 from multistorageclient.utils import glob as glob_util
@@ -125,3 +129,98 @@ class TestProviderBundle(ProviderBundle):
         Returns the metadata provider responsible for retrieving metadata about objects in the storage service.
         """
         return TestMetadataProvider()
+
+
+class InMemoryByteStoreProvider(BaseStorageProvider):
+    """
+    A storage provider backed by a ``dict[str, bytes]``.
+
+    Used by tests which only exercise client or metadata provider logic and don't need a real storage backend.
+    """
+
+    def __init__(self):
+        super().__init__(base_path="", provider_name="memory")
+        self._objects: dict[str, bytes] = {}
+        self._last_modified: dict[str, datetime] = {}
+
+    def _put_object(
+        self,
+        path: str,
+        body: bytes,
+        metadata: Optional[dict[str, str]] = None,
+        if_match: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+    ) -> int:
+        self._objects[path] = bytes(body)
+        self._last_modified[path] = datetime.now(tz=timezone.utc)
+        return len(body)
+
+    def _get_object(self, path: str, byte_range: Optional[Range] = None) -> bytes:
+        if path not in self._objects:
+            raise FileNotFoundError(f"Object {path} does not exist.")
+        body = self._objects[path]
+        if byte_range:
+            return body[byte_range.offset : byte_range.offset + byte_range.size]
+        return body
+
+    def _copy_object(self, src_path: str, dest_path: str) -> int:
+        return self._put_object(dest_path, self._get_object(src_path))
+
+    def _delete_object(self, path: str, if_match: Optional[str] = None) -> None:
+        self._objects.pop(path, None)
+        self._last_modified.pop(path, None)
+
+    def _get_object_metadata(self, path: str, strict: bool = True) -> ObjectMetadata:
+        if path in self._objects:
+            return ObjectMetadata(
+                key=path, content_length=len(self._objects[path]), last_modified=self._last_modified[path]
+            )
+        directory_path = self._append_delimiter(path)
+        if any(key.startswith(directory_path) for key in self._objects):
+            return ObjectMetadata(
+                key=directory_path, type="directory", content_length=0, last_modified=AWARE_DATETIME_MIN
+            )
+        raise FileNotFoundError(f"Object {path} does not exist.")
+
+    def _list_objects(
+        self,
+        prefix: str,
+        start_after: Optional[str] = None,
+        end_at: Optional[str] = None,
+        include_directories: bool = False,
+    ) -> Iterator[ObjectMetadata]:
+        directories: set[str] = set()
+        for key in sorted(self._objects):
+            if not key.startswith(prefix):
+                continue
+            if (start_after is not None and key <= start_after) or (end_at is not None and key > end_at):
+                continue
+            if include_directories and "/" in key[len(prefix) :]:
+                directory = key[: len(prefix) + key[len(prefix) :].index("/")]
+                if directory not in directories:
+                    directories.add(directory)
+                    yield ObjectMetadata(
+                        key=directory, type="directory", content_length=0, last_modified=AWARE_DATETIME_MIN
+                    )
+                continue
+            yield self._get_object_metadata(key)
+
+    def _upload_file(self, remote_path: str, f: Union[str, IO]) -> int:
+        if isinstance(f, str):
+            with open(f, "rb") as fp:
+                return self._put_object(remote_path, fp.read())
+        elif isinstance(f, io.StringIO):
+            return self._put_object(remote_path, f.getvalue().encode("utf-8"))
+        else:
+            return self._put_object(remote_path, f.read())
+
+    def _download_file(self, remote_path: str, f: Union[str, IO], metadata: Optional[ObjectMetadata] = None) -> int:
+        body = self._get_object(remote_path)
+        if isinstance(f, str):
+            with open(f, "wb") as fp:
+                fp.write(body)
+        elif isinstance(f, io.StringIO):
+            f.write(body.decode("utf-8"))
+        else:
+            f.write(body)
+        return len(body)
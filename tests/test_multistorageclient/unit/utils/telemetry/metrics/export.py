@@ -27,6 +27,8 @@ class InMemoryMetricExporter(sdk_metrics_export.MetricExporter):
 
     _metrics_data: Optional[sdk_metrics_export.MetricsData]
     _metrics_data_lock: threading.Lock
+    #: Set on each export. Lets tests wait for an export instead of sleeping.
+    _exported: threading.Event
 
     def __init__(
         self,
@@ -36,6 +38,7 @@ class InMemoryMetricExporter(sdk_metrics_export.MetricExporter):
         super().__init__(preferred_aggregation=preferred_aggregation, preferred_temporality=preferred_temporality)
         self._metrics_data = None
         self._metrics_data_lock = threading.Lock()
+        self._exported = threading.Event()
 
     def export(
         self,
@@ -45,6 +48,7 @@ class InMemoryMetricExporter(sdk_metrics_export.MetricExporter):
     ) -> sdk_metrics_export.MetricExportResult:
         with self._metrics_data_lock:
             self._metrics_data = metrics_data
+        self._exported.set()
         return sdk_metrics_export.MetricExportResult.SUCCESS
 
     def force_flush(self, timeout_millis: float = 0) -> bool:
@@ -53,5 +57,16 @@ class InMemoryMetricExporter(sdk_metrics_export.MetricExporter):
     def shutdown(self, timeout_millis: float = 0, **kwargs) -> None:
         pass
 
+    def wait_for_export(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an export.
+
+        :param timeout: Timeout in seconds.
+        :return: Whether an export happened before the timeout.
+        """
+        exported = self._exported.wait(timeout=timeout)
+        self._exported.clear()
+        return exported
+
     def metrics_data(self) -> Optional[sdk_metrics_export.MetricsData]:
         return self._metrics_data